@@ -4,14 +4,39 @@ API client for Movie Translate desktop application
 
 import asyncio
 import json
+import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import aiohttp
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Faster JSON is optional
+    orjson = None
+
+try:
+    import aiofiles
+except ImportError:  # Async file I/O is optional
+    aiofiles = None
+
 from ..core import logger, settings, error_handler, ErrorCategory, ErrorSeverity
 
 
+def _dump_project_json(project: Dict[str, Any]) -> bytes:
+    """Serialize project data to UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(project, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(project, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _load_project_json(data: bytes) -> Dict[str, Any]:
+    """Deserialize project data from JSON"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class APIClient:
     """API client for communicating with the backend service"""
     
@@ -19,29 +44,47 @@ class APIClient:
         self.base_url = base_url or f"http://{settings.api.host}:{settings.api.port}"
         self.session: Optional[aiohttp.ClientSession] = None
         self.timeout = aiohttp.ClientTimeout(total=settings.api.timeout)
+        # time.monotonic() of the last response from the API, if any
+        self.last_response_time: Optional[float] = None
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+        await self.startup()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
+        await self.close()
+    
+    async def startup(self):
+        """Open the pooled HTTP session used by all requests
+        
+        Must be awaited on the event loop that will make the requests.
+        Calling it again while the session is open is a no-op.
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                headers={"Content-Type": "application/json"},
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60)
+            )
+    
+    async def close(self):
+        """Close the HTTP session and its pooled connections"""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
     
     async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make HTTP request to API"""
         try:
             if not self.session:
-                raise RuntimeError("APIClient must be used as async context manager")
+                raise RuntimeError("APIClient session not started; await startup() or use as async context manager")
             
             url = f"{self.base_url}{endpoint}"
             
             async with self.session.request(method, url, **kwargs) as response:
+                self.last_response_time = time.monotonic()
                 if response.status == 200:
                     return await response.json()
                 else:
@@ -115,7 +158,7 @@ class APIClient:
         """Upload a file"""
         try:
             if not self.session:
-                raise RuntimeError("APIClient must be used as async context manager")
+                raise RuntimeError("APIClient session not started; await startup() or use as async context manager")
             
             url = f"{self.base_url}/upload"
             
@@ -147,7 +190,7 @@ class APIClient:
         """Download a file"""
         try:
             if not self.session:
-                raise RuntimeError("APIClient must be used as async context manager")
+                raise RuntimeError("APIClient session not started; await startup() or use as async context manager")
             
             url = f"{self.base_url}/download/{file_id}"
             
@@ -313,6 +356,57 @@ class ProjectManager:
             )
             raise
     
+    async def save_project(self, file_path: str, project: Optional[Dict[str, Any]] = None):
+        """Save project data (the current project by default) to a JSON file"""
+        try:
+            if project is None:
+                project = self.current_project
+            if project is None:
+                raise RuntimeError("No project to save")
+            
+            data = _dump_project_json(project)
+            
+            if aiofiles is not None:
+                async with aiofiles.open(file_path, "wb") as f:
+                    await f.write(data)
+            else:
+                await asyncio.to_thread(Path(file_path).write_bytes, data)
+            
+            logger.info(f"Project saved: {file_path}")
+        
+        except Exception as e:
+            error_handler.handle_error(
+                error=e,
+                context={"file_path": file_path},
+                category=ErrorCategory.FILE_SYSTEM,
+                severity=ErrorSeverity.HIGH
+            )
+            raise
+    
+    async def load_project(self, file_path: str) -> Dict[str, Any]:
+        """Load project data from a JSON file and make it the current project"""
+        try:
+            if aiofiles is not None:
+                async with aiofiles.open(file_path, "rb") as f:
+                    data = await f.read()
+            else:
+                data = await asyncio.to_thread(Path(file_path).read_bytes)
+            
+            project = _load_project_json(data)
+            self.current_project = project
+            
+            logger.info(f"Project loaded: {file_path}")
+            return project
+        
+        except Exception as e:
+            error_handler.handle_error(
+                error=e,
+                context={"file_path": file_path},
+                category=ErrorCategory.FILE_SYSTEM,
+                severity=ErrorSeverity.HIGH
+            )
+            raise
+    
     async def download_result(self, project_id: str, output_path: str) -> bool:
         """Download processed result"""
         try:
@@ -3,12 +3,13 @@ Interrupt recovery mechanism for Movie Translate
 Handles application interruptions and allows users to resume work from where they left off
 """
 
+import copy
 import json
 import pickle
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import threading
 import atexit
 import signal
@@ -30,6 +31,7 @@ class InterruptRecovery:
         self.last_save_time = None
         self.auto_save_timer = None
         self.is_running = False
+        self._write_lock = threading.Lock()
         
         # Register signal handlers
         self._register_signal_handlers()
@@ -120,13 +122,40 @@ class InterruptRecovery:
                 logger.warning("No state to save")
                 return
             
+            self._write_state(self.current_state)
+            
+        except Exception as e:
+            error_handler.handle_error(
+                error=e,
+                context={"operation": "save_recovery_state"},
+                severity=ErrorSeverity.HIGH
+            )
+    
+    def write_snapshot(self, state: Dict[str, Any]):
+        """Write a state snapshot to the recovery file
+        
+        Unlike save_state, the in-memory state is left untouched, so this can
+        run on a worker thread with a copy taken by snapshot_state().
+        """
+        try:
+            self._write_state(state)
+        except Exception as e:
+            error_handler.handle_error(
+                error=e,
+                context={"operation": "write_recovery_snapshot"},
+                severity=ErrorSeverity.HIGH
+            )
+    
+    def _write_state(self, state: Dict[str, Any]):
+        """Write state with metadata to the recovery file, keeping a backup"""
+        with self._write_lock:
             # Create backup of existing file
             if self.recovery_file.exists():
                 shutil.copy2(self.recovery_file, self.backup_file)
             
             # Save state with metadata
             save_data = {
-                'state': self.current_state,
+                'state': state,
                 'timestamp': datetime.now().isoformat(),
                 'version': settings.__version__,
                 'platform': sys.platform
@@ -138,16 +167,22 @@ class InterruptRecovery:
             
             self.last_save_time = datetime.now()
             logger.info(f"State saved to {self.recovery_file}")
-            
-        except Exception as e:
-            error_handler.handle_error(
-                error=e,
-                context={"operation": "save_recovery_state"},
-                severity=ErrorSeverity.ERROR
-            )
     
     def load_state(self) -> Optional[Dict[str, Any]]:
         """Load state from recovery file"""
+        save_data = self._read_save_data()
+        if save_data is None:
+            return None
+        
+        self.current_state = save_data['state']
+        return self.current_state
+    
+    def _read_save_data(self) -> Optional[Dict[str, Any]]:
+        """Read and validate the recovery file, falling back to the backup
+        
+        Does not touch current_state, so it is safe to call from a worker
+        thread.
+        """
         try:
             if not self.recovery_file.exists():
                 logger.info("No recovery file found")
@@ -167,16 +202,14 @@ class InterruptRecovery:
                 logger.warning("Invalid recovery state")
                 return None
             
-            self.current_state = save_data['state']
             logger.info(f"State loaded from {self.recovery_file}")
-            
-            return self.current_state
+            return save_data
             
         except Exception as e:
             error_handler.handle_error(
                 error=e,
                 context={"operation": "load_recovery_state"},
-                severity=ErrorSeverity.ERROR
+                severity=ErrorSeverity.HIGH
             )
             
             # Try to load from backup
@@ -187,9 +220,8 @@ class InterruptRecovery:
                         save_data = pickle.load(f)
                     
                     if self._validate_state(save_data):
-                        self.current_state = save_data['state']
                         logger.info("State loaded from backup")
-                        return self.current_state
+                        return save_data
                         
                 except Exception as backup_e:
                     logger.error(f"Failed to load backup: {backup_e}")
@@ -242,18 +274,37 @@ class InterruptRecovery:
                 with open(self.recovery_file, 'rb') as f:
                     save_data = pickle.load(f)
                 
-                info['has_state'] = True
-                info['timestamp'] = save_data['timestamp']
-                info['version'] = save_data['version']
-                
-                timestamp = datetime.fromisoformat(save_data['timestamp'])
-                info['age'] = (datetime.now() - timestamp).total_seconds()
+                info = self._recovery_info_from(save_data)
                 
         except Exception as e:
             logger.error(f"Failed to get recovery info: {e}")
         
         return info
     
+    def _recovery_info_from(self, save_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build recovery info from loaded save data"""
+        timestamp = datetime.fromisoformat(save_data['timestamp'])
+        return {
+            'has_state': True,
+            'timestamp': save_data['timestamp'],
+            'version': save_data['version'],
+            'age': (datetime.now() - timestamp).total_seconds()
+        }
+    
+    def get_recovery_snapshot(self) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Get recovery info and state from a single read of the recovery file
+        
+        Reads like load_state(), backup fallback included, but the file is
+        only read and unpickled once. current_state is left alone so this
+        can run on a worker thread; the caller adopts the state itself.
+        Returns None if there is no usable recovery state.
+        """
+        save_data = self._read_save_data()
+        if save_data is None:
+            return None
+        
+        return self._recovery_info_from(save_data), save_data['state']
+    
     def clear_recovery_state(self):
         """Clear recovery state"""
         try:
@@ -302,6 +353,36 @@ class InterruptRecovery:
         if self.is_running:
             self.save_state()
     
+    def update_state(self, project_data: Optional[Dict[str, Any]] = None,
+                     step_states: Optional[Dict[int, Dict[str, Any]]] = None):
+        """Update project and step states in memory without saving"""
+        if self.current_state is None:
+            self.current_state = {}
+        
+        now = datetime.now().isoformat()
+        
+        if project_data is not None:
+            self.current_state['project'] = project_data
+        
+        if step_states:
+            steps = self.current_state.setdefault('steps', {})
+            for step, step_data in step_states.items():
+                steps[step] = {
+                    'data': step_data,
+                    'timestamp': now
+                }
+        
+        self.current_state['last_updated'] = now
+    
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Get a copy of the current state that is safe to write from another thread
+        
+        Call this on the thread that owns the state. The copy is deep because
+        the writer pickles every nested step dict while the UI keeps changing
+        them.
+        """
+        return copy.deepcopy(self.current_state or {})
+    
     def get_project_state(self) -> Optional[Dict[str, Any]]:
         """Get project state from recovery"""
         if self.current_state and 'project' in self.current_state:
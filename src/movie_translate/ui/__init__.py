@@ -2,13 +2,20 @@
 UI module initialization
 """
 
-from .main_app import MovieTranslateApp, main
-from .step_navigator import StepNavigator
-from .file_import import FileImportFrame
-from .character_manager import CharacterManagerFrame
-from .settings_panel import SettingsPanel
-from .progress_display import ProgressDisplay
-from .recovery_dialog import show_recovery_dialog
+import importlib
+
+# Public name -> defining submodule; submodules are imported on first access
+# so importing one UI module does not pull in every other one
+_EXPORTS = {
+    "MovieTranslateApp": ".main_app",
+    "main": ".main_app",
+    "StepNavigator": ".step_navigator",
+    "FileImportFrame": ".file_import",
+    "CharacterManagerFrame": ".character_manager",
+    "SettingsPanel": ".settings_panel",
+    "ProgressDisplay": ".progress_display",
+    "show_recovery_dialog": ".recovery_dialog",
+}
 
 __all__ = [
     "MovieTranslateApp",
@@ -19,4 +26,14 @@ __all__ = [
     "SettingsPanel",
     "ProgressDisplay",
     "show_recovery_dialog"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -291,43 +291,45 @@ class CharacterManagerFrame(ctk.CTkFrame):
             messagebox.showerror("错误", "请先导入视频文件")
             return
         
+        def on_detection_complete(characters, error):
+            self.app.hide_progress()
+            if error:
+                messagebox.showerror("错误", f"识别失败: {error}")
+                return
+            
+            for char_data in characters:
+                self._add_character_to_list(char_data)
+            
+            messagebox.showinfo("成功", f"识别到 {len(characters)} 个角色")
+            self.next_btn.configure(state="normal")
+        
+        # detect() runs on the app's async loop thread; UI updates go through app.call_in_ui
         async def detect():
-            try:
-                self.app.show_progress("正在识别角色...")
-                self.app.update_progress(0, "开始识别")
-                
-                # TODO: Implement character detection
-                # For now, add some mock characters
-                self.app.update_progress(30, "分析音频特征")
-                await asyncio.sleep(1)
-                
-                self.app.update_progress(60, "识别声音模式")
-                await asyncio.sleep(1)
-                
-                self.app.update_progress(90, "生成角色信息")
-                await asyncio.sleep(1)
-                
-                # Add mock characters
-                mock_characters = [
-                    {'id': 'char_001', 'name': '角色1', 'language': 'zh', 'samples': 5},
-                    {'id': 'char_002', 'name': '角色2', 'language': 'zh', 'samples': 3},
-                    {'id': 'char_003', 'name': '角色3', 'language': 'zh', 'samples': 7}
-                ]
-                
-                for char_data in mock_characters:
-                    self._add_character_to_list(char_data)
-                
-                self.app.update_progress(100, "识别完成")
-                self.app.hide_progress()
-                
-                messagebox.showinfo("成功", f"识别到 {len(mock_characters)} 个角色")
-                self.next_btn.configure(state="normal")
-                
-            except Exception as e:
-                self.app.hide_progress()
-                messagebox.showerror("错误", f"识别失败: {e}")
+            self.app.call_in_ui(self.app.show_progress, "正在识别角色...")
+            self.app.call_in_ui(self.app.update_progress, 0, "开始识别")
+            
+            # TODO: Implement character detection
+            # For now, add some mock characters
+            self.app.call_in_ui(self.app.update_progress, 30, "分析音频特征")
+            await asyncio.sleep(1)
+            
+            self.app.call_in_ui(self.app.update_progress, 60, "识别声音模式")
+            await asyncio.sleep(1)
+            
+            self.app.call_in_ui(self.app.update_progress, 90, "生成角色信息")
+            await asyncio.sleep(1)
+            
+            # Add mock characters
+            mock_characters = [
+                {'id': 'char_001', 'name': '角色1', 'language': 'zh', 'samples': 5},
+                {'id': 'char_002', 'name': '角色2', 'language': 'zh', 'samples': 3},
+                {'id': 'char_003', 'name': '角色3', 'language': 'zh', 'samples': 7}
+            ]
+            
+            self.app.call_in_ui(self.app.update_progress, 100, "识别完成")
+            return mock_characters
         
-        self.app.run_async(detect())
+        self.app.run_async(detect(), on_detection_complete)
     
     def _add_character(self):
         """Add new character manually"""
@@ -607,26 +609,26 @@ class CharacterManagerFrame(ctk.CTkFrame):
             messagebox.showwarning("警告", "请先添加角色")
             return
         
-        async def analyze():
-            try:
-                self.app.show_progress("正在分析角色...")
-                self.app.update_progress(0, "开始分析")
-                
-                # TODO: Implement character analysis
-                self.app.update_progress(50, "分析声音特征")
-                await asyncio.sleep(1)
-                
-                self.app.update_progress(100, "分析完成")
-                self.app.hide_progress()
-                
+        def on_analysis_complete(result, error):
+            self.app.hide_progress()
+            if error:
+                messagebox.showerror("错误", f"分析失败: {error}")
+            else:
                 messagebox.showinfo("成功", "角色分析完成")
                 self.next_btn.configure(state="normal")
-                
-            except Exception as e:
-                self.app.hide_progress()
-                messagebox.showerror("错误", f"分析失败: {e}")
         
-        self.app.run_async(analyze())
+        # analyze() runs on the app's async loop thread; UI updates go through app.call_in_ui
+        async def analyze():
+            self.app.call_in_ui(self.app.show_progress, "正在分析角色...")
+            self.app.call_in_ui(self.app.update_progress, 0, "开始分析")
+            
+            # TODO: Implement character analysis
+            self.app.call_in_ui(self.app.update_progress, 50, "分析声音特征")
+            await asyncio.sleep(1)
+            
+            self.app.call_in_ui(self.app.update_progress, 100, "分析完成")
+        
+        self.app.run_async(analyze(), on_analysis_complete)
     
     def _prev_step(self):
         """Navigate to previous step"""
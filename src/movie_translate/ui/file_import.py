@@ -6,19 +6,56 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Iterable
 import asyncio
+import functools
+
+try:
+    from tkinterdnd2 import DND_FILES
+except ImportError:  # Drag-and-drop is optional
+    DND_FILES = None
+
+from movie_translate.ui.fonts import get_font
+
+
+def _filetypes(label: str, extensions: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """Build a filedialog ``filetypes`` tuple from a list of extensions"""
+    return ((label, " ".join(f"*{ext}" for ext in extensions)), ("所有文件", "*.*"))
 
 
 class FileImportFrame(ctk.CTkFrame):
     """File import frame for step 1"""
     
+    # Supported extensions, shared by the file dialogs and drop handling
+    _VIDEO_EXTS = (".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv", ".webm")
+    _SUB_EXTS = (".srt", ".ass", ".ssa", ".sub")
+    _AUDIO_EXTS = (".wav", ".mp3", ".flac", ".aac", ".ogg")
+    
+    _VIDEO_FILETYPES = _filetypes("视频文件", _VIDEO_EXTS)
+    _SUB_FILETYPES = _filetypes("字幕文件", _SUB_EXTS)
+    _AUDIO_FILETYPES = _filetypes("音频文件", _AUDIO_EXTS)
+    
+    # Extension -> file kind lookup for dropped files
+    _EXT_KINDS = {
+        **dict.fromkeys(_VIDEO_EXTS, "video"),
+        **dict.fromkeys(_SUB_EXTS, "subtitle"),
+        **dict.fromkeys(_AUDIO_EXTS, "audio"),
+    }
+    
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
         self.video_file = None
         self.subtitle_file = None
         self.audio_files = []
+        self._audio_files_set = set()  # Mirrors audio_files for O(1) membership checks
+        
+        # Audio list rows keyed by path, so list updates only touch changed rows
+        self._audio_row_widgets: Dict[Path, Tuple[ctk.CTkFrame, ctk.CTkLabel, ctk.CTkButton]] = {}
+        self._audio_row_indices: Dict[Path, int] = {}
+        
+        # Set while a _check_can_proceed run is queued with after_idle
+        self._check_pending = False
         
         self._create_ui()
     
@@ -35,14 +72,14 @@ class FileImportFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="文件导入",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         title_label.grid(row=0, column=0, padx=20, pady=15)
         
         description_label = ctk.CTkLabel(
             header_frame,
             text="导入视频文件和相关资料，支持拖拽上传",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         description_label.grid(row=0, column=1, padx=20, pady=15, sticky="w")
         
@@ -60,14 +97,14 @@ class FileImportFrame(ctk.CTkFrame):
         video_label = ctk.CTkLabel(
             video_frame,
             text="🎬 视频文件",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         video_label.grid(row=0, column=0, padx=10, pady=10)
         
         self.video_path_label = ctk.CTkLabel(
             video_frame,
             text="未选择视频文件",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color="gray"
         )
         self.video_path_label.grid(row=0, column=1, padx=10, pady=10, sticky="w")
@@ -93,14 +130,14 @@ class FileImportFrame(ctk.CTkFrame):
         subtitle_label = ctk.CTkLabel(
             subtitle_frame,
             text="📝 字幕文件 (可选)",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         subtitle_label.grid(row=0, column=0, padx=10, pady=10)
         
         self.subtitle_path_label = ctk.CTkLabel(
             subtitle_frame,
             text="未选择字幕文件",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color="gray"
         )
         self.subtitle_path_label.grid(row=0, column=1, padx=10, pady=10, sticky="w")
@@ -135,14 +172,14 @@ class FileImportFrame(ctk.CTkFrame):
         audio_label = ctk.CTkLabel(
             audio_header_frame,
             text="🎵 音频文件 (可选)",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         audio_label.grid(row=0, column=0, padx=10, pady=10)
         
         self.audio_count_label = ctk.CTkLabel(
             audio_header_frame,
             text="已添加 0 个音频文件",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.audio_count_label.grid(row=0, column=1, padx=10, pady=10, sticky="w")
         
@@ -177,7 +214,7 @@ class FileImportFrame(ctk.CTkFrame):
         lang_label = ctk.CTkLabel(
             settings_frame,
             text="目标语言:",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         lang_label.grid(row=0, column=0, padx=10, pady=10, sticky="w")
         
@@ -234,34 +271,49 @@ class FileImportFrame(ctk.CTkFrame):
         self._setup_drag_drop()
     
     def _setup_drag_drop(self):
-        """Setup drag and drop functionality"""
-        # This is a basic implementation
-        # For full drag and drop, you might need additional libraries
-        self.bind("<Button-1>", self._on_drop_enter)
-        self.bind("<B1-Motion>", self._on_drop_motion)
-        self.bind("<ButtonRelease-1>", self._on_drop_release)
+        """Register the frame as a drop target for files from the OS"""
+        if DND_FILES is None or not getattr(self.app, 'dnd_available', False):
+            return
+        
+        self.drop_target_register(DND_FILES)
+        self.dnd_bind('<<DropEnter>>', self._on_drop_enter)
+        self.dnd_bind('<<DropLeave>>', self._on_drop_leave)
+        self.dnd_bind('<<Drop>>', self._on_files_dropped)
     
     def _on_drop_enter(self, event):
         """Handle drag enter"""
         self.configure(fg_color=("gray90", "gray20"))
+        return event.action
     
-    def _on_drop_motion(self, event):
-        """Handle drag motion"""
-        pass
+    def _on_drop_leave(self, event):
+        """Handle drag leave"""
+        self.configure(fg_color=("gray95", "gray10"))
+        return event.action
     
-    def _on_drop_release(self, event):
-        """Handle drop release"""
+    def _on_files_dropped(self, event):
+        """Handle dropped files, dispatching each one by extension"""
         self.configure(fg_color=("gray95", "gray10"))
-        # In a real implementation, you would handle file drops here
+        
+        audio_paths = []
+        for file_path in self.tk.splitlist(event.data):
+            kind = self._EXT_KINDS.get(Path(file_path).suffix.lower())
+            if kind == "video":
+                self._set_video_file(file_path)
+            elif kind == "subtitle":
+                self._set_subtitle_file(file_path)
+            elif kind == "audio":
+                audio_paths.append(file_path)
+        
+        if audio_paths:
+            self._add_audio_files(audio_paths)
+        
+        return event.action
     
     def _browse_video(self):
         """Browse for video file"""
         file_path = filedialog.askopenfilename(
             title="选择视频文件",
-            filetypes=[
-                ("视频文件", "*.mp4 *.avi *.mkv *.mov *.wmv *.flv *.webm"),
-                ("所有文件", "*.*")
-            ]
+            filetypes=self._VIDEO_FILETYPES
         )
         
         if file_path:
@@ -271,10 +323,7 @@ class FileImportFrame(ctk.CTkFrame):
         """Browse for subtitle file"""
         file_path = filedialog.askopenfilename(
             title="选择字幕文件",
-            filetypes=[
-                ("字幕文件", "*.srt *.ass *.ssa *.sub"),
-                ("所有文件", "*.*")
-            ]
+            filetypes=self._SUB_FILETYPES
         )
         
         if file_path:
@@ -284,14 +333,10 @@ class FileImportFrame(ctk.CTkFrame):
         """Add audio file"""
         file_paths = filedialog.askopenfilenames(
             title="选择音频文件",
-            filetypes=[
-                ("音频文件", "*.wav *.mp3 *.flac *.aac *.ogg"),
-                ("所有文件", "*.*")
-            ]
+            filetypes=self._AUDIO_FILETYPES
         )
         
-        for file_path in file_paths:
-            self._add_audio_file(file_path)
+        self._add_audio_files(file_paths)
     
     def _set_video_file(self, file_path: str):
         """Set video file and update UI"""
@@ -331,50 +376,59 @@ class FileImportFrame(ctk.CTkFrame):
     def _add_audio_file(self, file_path: str):
         """Add audio file to list"""
         audio_path = Path(file_path)
-        if audio_path not in self.audio_files:
+        if audio_path in self._audio_files_set:
+            return
+        self._audio_files_set.add(audio_path)
+        self.audio_files.append(audio_path)
+        self._update_audio_list()
+    
+    def _add_audio_files(self, file_paths: Iterable[str]):
+        """Add several audio files to list with a single display update"""
+        added = False
+        for file_path in file_paths:
+            audio_path = Path(file_path)
+            if audio_path in self._audio_files_set:
+                continue
+            self._audio_files_set.add(audio_path)
             self.audio_files.append(audio_path)
+            added = True
+        
+        if added:
             self._update_audio_list()
     
     def _remove_audio_file(self, audio_path: Path):
         """Remove audio file from list"""
-        if audio_path in self.audio_files:
+        if audio_path in self._audio_files_set:
+            self._audio_files_set.discard(audio_path)
             self.audio_files.remove(audio_path)
             self._update_audio_list()
     
     def _clear_audio(self):
         """Clear all audio files"""
         self.audio_files.clear()
+        self._audio_files_set.clear()
         self._update_audio_list()
     
     def _update_audio_list(self):
         """Update audio files list display"""
-        # Clear existing widgets
-        for widget in self.audio_list_frame.winfo_children():
-            widget.destroy()
-        
-        # Add audio files
+        # Destroy rows for removed files
+        removed_files = [f for f in self._audio_row_widgets if f not in self._audio_files_set]
+        for audio_file in removed_files:
+            row_frame, _, _ = self._audio_row_widgets.pop(audio_file)
+            del self._audio_row_indices[audio_file]
+            row_frame.destroy()
+        
+        # Create rows for new files and re-grid rows whose position changed
         for i, audio_file in enumerate(self.audio_files):
-            audio_frame = ctk.CTkFrame(self.audio_list_frame)
-            audio_frame.grid(row=i, column=0, sticky="ew", padx=5, pady=2)
-            audio_frame.grid_columnconfigure(0, weight=1)
-            
-            # Audio file name
-            name_label = ctk.CTkLabel(
-                audio_frame,
-                text=audio_file.name,
-                font=ctk.CTkFont(size=11)
-            )
-            name_label.grid(row=0, column=0, padx=5, pady=5, sticky="w")
+            if audio_file not in self._audio_row_widgets:
+                self._audio_row_widgets[audio_file] = self._create_audio_row(audio_file)
+            elif self._audio_row_indices[audio_file] == i:
+                continue
             
-            # Remove button
-            remove_btn = ctk.CTkButton(
-                audio_frame,
-                text="移除",
-                command=lambda f=audio_file: self._remove_audio_file(f),
-                width=60,
-                height=25
-            )
-            remove_btn.grid(row=0, column=1, padx=5, pady=5)
+            row_frame = self._audio_row_widgets[audio_file][0]
+            row_frame.grid_forget()
+            row_frame.grid(row=i, column=0, sticky="ew", padx=5, pady=2)
+            self._audio_row_indices[audio_file] = i
         
         # Update count
         self.audio_count_label.configure(text=f"已添加 {len(self.audio_files)} 个音频文件")
@@ -382,6 +436,31 @@ class FileImportFrame(ctk.CTkFrame):
         # Update clear button state
         self.audio_clear_btn.configure(state="normal" if self.audio_files else "disabled")
     
+    def _create_audio_row(self, audio_file: Path) -> Tuple[ctk.CTkFrame, ctk.CTkLabel, ctk.CTkButton]:
+        """Create the widgets for one audio file row (gridded by the caller)"""
+        audio_frame = ctk.CTkFrame(self.audio_list_frame)
+        audio_frame.grid_columnconfigure(0, weight=1)
+        
+        # Audio file name
+        name_label = ctk.CTkLabel(
+            audio_frame,
+            text=audio_file.name,
+            font=get_font(11)
+        )
+        name_label.grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        
+        # Remove button
+        remove_btn = ctk.CTkButton(
+            audio_frame,
+            text="移除",
+            command=functools.partial(self._remove_audio_file, audio_file),
+            width=60,
+            height=25
+        )
+        remove_btn.grid(row=0, column=1, padx=5, pady=5)
+        
+        return audio_frame, name_label, remove_btn
+    
     def _show_video_info(self):
         """Show video file information"""
         if not self.video_file:
@@ -399,13 +478,21 @@ class FileImportFrame(ctk.CTkFrame):
         info_label = ctk.CTkLabel(
             self.video_info_frame,
             text=info_text,
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="gray"
         )
         info_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
     
     def _check_can_proceed(self):
-        """Check if we can proceed to next step"""
+        """Check if we can proceed to next step (coalesced to once per idle)"""
+        if self._check_pending:
+            return
+        self._check_pending = True
+        self.after_idle(self._do_check_can_proceed)
+    
+    def _do_check_can_proceed(self):
+        """Update next button state from the current selection"""
+        self._check_pending = False
         if self.video_file:
             self.next_btn.configure(state="normal")
         else:
@@ -417,42 +504,42 @@ class FileImportFrame(ctk.CTkFrame):
             messagebox.showerror("错误", "请先选择视频文件")
             return
         
-        async def analyze():
-            try:
-                self.app.show_progress("正在分析文件...")
-                self.app.update_progress(0, "开始分析")
-                
-                # Analyze video file
-                self.app.update_progress(20, "分析视频文件")
-                # TODO: Implement video analysis
-                
-                # Analyze subtitle file if present
-                if self.subtitle_file:
-                    self.app.update_progress(40, "分析字幕文件")
-                    # TODO: Implement subtitle analysis
-                
-                # Analyze audio files if present
-                if self.audio_files:
-                    self.app.update_progress(60, "分析音频文件")
-                    # TODO: Implement audio analysis
-                
-                # Final analysis
-                self.app.update_progress(80, "完成分析")
-                # TODO: Implement final analysis
-                
-                self.app.update_progress(100, "分析完成")
-                self.app.hide_progress()
-                
+        def on_analysis_complete(result, error):
+            self.app.hide_progress()
+            if error:
+                messagebox.showerror("错误", f"分析失败: {error}")
+            else:
                 messagebox.showinfo("成功", "文件分析完成")
                 
                 # Enable next step
                 self.next_btn.configure(state="normal")
-                
-            except Exception as e:
-                self.app.hide_progress()
-                messagebox.showerror("错误", f"分析失败: {e}")
         
-        self.app.run_async(analyze())
+        # analyze() runs on the app's async loop thread; UI updates go through app.call_in_ui
+        async def analyze():
+            self.app.call_in_ui(self.app.show_progress, "正在分析文件...")
+            self.app.call_in_ui(self.app.update_progress, 0, "开始分析")
+            
+            # Analyze video file
+            self.app.call_in_ui(self.app.update_progress, 20, "分析视频文件")
+            # TODO: Implement video analysis
+            
+            # Analyze subtitle file if present
+            if self.subtitle_file:
+                self.app.call_in_ui(self.app.update_progress, 40, "分析字幕文件")
+                # TODO: Implement subtitle analysis
+            
+            # Analyze audio files if present
+            if self.audio_files:
+                self.app.call_in_ui(self.app.update_progress, 60, "分析音频文件")
+                # TODO: Implement audio analysis
+            
+            # Final analysis
+            self.app.call_in_ui(self.app.update_progress, 80, "完成分析")
+            # TODO: Implement final analysis
+            
+            self.app.call_in_ui(self.app.update_progress, 100, "分析完成")
+        
+        self.app.run_async(analyze(), on_analysis_complete)
     
     def _next_step(self):
         """Navigate to next step"""
@@ -462,13 +549,7 @@ class FileImportFrame(ctk.CTkFrame):
         
         # Save file information to project
         if self.app.current_project:
-            self.app.current_project['video_file'] = str(self.video_file)
-            if self.subtitle_file:
-                self.app.current_project['subtitle_file'] = str(self.subtitle_file)
-            if self.audio_files:
-                self.app.current_project['audio_files'] = [str(f) for f in self.audio_files]
-            self.app.current_project['target_language'] = self.target_lang_var.get()
-            self.app.current_project['auto_detect_language'] = self.auto_detect_var.get()
+            self.app.current_project.update(self.get_imported_files())
         
         # Navigate to next step
         self.app._navigate_to_step(1)
@@ -478,14 +559,17 @@ class FileImportFrame(ctk.CTkFrame):
         self._check_can_proceed()
     
     def get_imported_files(self) -> Dict[str, Any]:
-        """Get imported files information"""
-        return {
-            'video_file': str(self.video_file) if self.video_file else None,
-            'subtitle_file': str(self.subtitle_file) if self.subtitle_file else None,
-            'audio_files': [str(f) for f in self.audio_files],
-            'target_language': self.target_lang_var.get(),
-            'auto_detect_language': self.auto_detect_var.get()
-        }
+        """Get imported files information (files not chosen are left out)"""
+        files = {}
+        if self.video_file:
+            files['video_file'] = str(self.video_file)
+        if self.subtitle_file:
+            files['subtitle_file'] = str(self.subtitle_file)
+        if self.audio_files:
+            files['audio_files'] = [str(f) for f in self.audio_files]
+        files['target_language'] = self.target_lang_var.get()
+        files['auto_detect_language'] = self.auto_detect_var.get()
+        return files
     
     def set_imported_files(self, files: Dict[str, Any]):
         """Set imported files from project data"""
@@ -496,8 +580,7 @@ class FileImportFrame(ctk.CTkFrame):
             self._set_subtitle_file(files['subtitle_file'])
         
         if files.get('audio_files'):
-            for audio_file in files['audio_files']:
-                self._add_audio_file(audio_file)
+            self._add_audio_files(files['audio_files'])
         
         if files.get('target_language'):
             self.target_lang_var.set(files['target_language'])
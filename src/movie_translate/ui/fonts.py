@@ -0,0 +1,17 @@
+"""
+Shared font cache for Movie Translate UI
+"""
+
+import functools
+
+import customtkinter as ctk
+
+
+@functools.cache
+def get_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Get a shared font instance for the given size and weight
+    
+    Fonts are created on first request, so this must only be called once
+    the root window exists.
+    """
+    return ctk.CTkFont(size=size, weight=weight)
@@ -4,38 +4,117 @@ Main UI application for Movie Translate
 
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import filedialog, messagebox
 import asyncio
 import threading
+import time
+from collections import deque
 from pathlib import Path
 from typing import Optional, Dict, Any
 import json
 
 from movie_translate.core import logger, settings
-from movie_translate.core.interrupt_recovery import get_interrupt_recovery
-from movie_translate.api.client import APIClient, ProjectManager
-from movie_translate.models import initialize_database
+from movie_translate.ui.fonts import get_font
 from movie_translate.ui.step_navigator import StepNavigator
-from movie_translate.ui.file_import import FileImportFrame
-from movie_translate.ui.character_manager import CharacterManagerFrame
-from movie_translate.ui.settings_panel import SettingsPanel
-from movie_translate.ui.progress_display import ProgressDisplay
-from movie_translate.ui.recovery_dialog import show_recovery_dialog
 
+# The API client (aiohttp), database layer, interrupt recovery, progress
+# display, step frames, dialogs and the optional tkinterdnd2/uvloop packages
+# are imported where they are first used so they stay off the startup path
+
+
+# File dialog filters
+_MEDIA_FILETYPES = (
+    ("所有媒体文件", "*.mp4 *.avi *.mkv *.mov *.wmv *.flv *.webm *.mp3 *.wav *.flac *.aac *.ogg *.m4a *.wma"),
+    ("视频文件", "*.mp4 *.avi *.mkv *.mov *.wmv *.flv *.webm"),
+    ("音频文件", "*.mp3 *.wav *.flac *.aac *.ogg *.m4a *.wma"),
+    ("所有文件", "*.*")
+)
+_PROJECT_FILETYPES = (
+    ("项目文件", "*.json"),
+    ("所有文件", "*.*")
+)
+_EXPORT_FILETYPES = (
+    ("MP4文件", "*.mp4"),
+    ("AVI文件", "*.avi"),
+    ("所有文件", "*.*")
+)
 
 class MovieTranslateApp(ctk.CTk):
     """Main application window for Movie Translate"""
     
+    # API health check retry delay, doubled after each failure up to the
+    # maximum; while connected the check runs at the maximum interval
+    HEALTH_CHECK_INTERVAL_MS = 30000
+    HEALTH_CHECK_MAX_INTERVAL_MS = 300000
+    
+    # Header text for each processing step
+    STEP_TITLES = (
+        "文件导入",
+        "角色管理",
+        "语音识别",
+        "翻译处理",
+        "声音克隆",
+        "视频合成"
+    )
+    STEP_DESCRIPTIONS = (
+        "导入视频文件和相关资料",
+        "识别和管理配音角色",
+        "自动识别视频中的语音内容",
+        "翻译识别到的文本内容",
+        "为角色生成克隆声音",
+        "合成最终的视频文件"
+    )
+    # Status bar text/progress writes are coalesced and applied at this rate
+    STATUS_FLUSH_INTERVAL_MS = 50
+    
+    # How often the Tk thread checks whether the async shutdown has finished
+    SHUTDOWN_POLL_INTERVAL_MS = 20
+    
+    # On close, wait this long for pending saves, then this long overall
+    CLOSE_SAVE_TIMEOUT = 2.0
+    CLOSE_TIMEOUT = 3.0
+    
+    # Non-blocking notifications shown for the results of background operations
+    TOAST_DURATION_MS = 3500
+    TOAST_COLORS = {
+        "info": "#2E7D32",
+        "error": "#C62828"
+    }
+    
+    STEP_HEADERS = tuple(f"步骤 {i + 1}: {title}" for i, title in enumerate(STEP_TITLES))
+    
     def __init__(self):
         # Initialize basic attributes first
         self.current_project = None
         self.current_step = 0
         self.async_loop = None
         self.async_thread = None
+        self._health_check_delay_ms = self.HEALTH_CHECK_INTERVAL_MS
+        self._health_check_id = None
+        self._db_future = None
+        self._db_error: Optional[str] = None
+        self._db_pending_actions = []
+        self._last_connection_state: Optional[bool] = None
+        self._new_project_dialog = None
+        self._pending_status_updates = {}
+        self._status_flush_id = None
+        self._toast_frame = None
+        self._toast_hide_id = None
+        self._ui_queue = deque()
+        self._ui_drain_armed = False
+        self._closing = False
+        self._first_mapped = False
+        self._background_tasks = set()
+        
+        from movie_translate.core.interrupt_recovery import get_interrupt_recovery
+        self._recovery = get_interrupt_recovery()
         
         # Initialize the window first
         super().__init__()
         
+        # Load tkdnd into this interpreter so frames can accept file drops
+        self.dnd_available = self._enable_drag_drop()
+        
         # Configure window
         self.title("Movie Translate - 电影翻译配音工具")
         self.geometry("1400x1200")
@@ -57,11 +136,38 @@ class MovieTranslateApp(ctk.CTk):
         # Initialize components
         self._initialize_components()
         
-        # Initialize heavy components after UI is ready
-        self.after(100, self._initialize_heavy_components)
+        # Initialize heavy components once the window is first shown
+        self.bind('<Map>', self._on_first_map, add='+')
         
         logger.info("Main UI application initialized")
     
+    def _on_first_map(self, event):
+        """Start heavy initialization right after the window first appears"""
+        # Child widgets' <Map> events also reach the window's binding, and the
+        # window maps again after being restored; only the first one counts.
+        # The binding is kept because unbind would drop every <Map> script.
+        if event.widget is not self or self._first_mapped:
+            return
+        
+        self._first_mapped = True
+        # Let the first paint run before the heavy work starts
+        self.after_idle(self._initialize_heavy_components)
+    
+    def _enable_drag_drop(self) -> bool:
+        """Enable OS drag-and-drop if tkinterdnd2 is installed"""
+        try:
+            from tkinterdnd2 import TkinterDnD
+        except ImportError:  # Drag-and-drop is optional
+            logger.info("tkinterdnd2 not installed, file drag-and-drop disabled")
+            return False
+        
+        try:
+            TkinterDnD._require(self)
+            return True
+        except (RuntimeError, tk.TclError) as e:
+            logger.warning(f"Failed to load tkdnd, file drag-and-drop disabled: {e}")
+            return False
+    
     def _create_sidebar(self):
         """Create sidebar with navigation"""
         self.sidebar = ctk.CTkFrame(self, width=250, corner_radius=0)
@@ -72,7 +178,7 @@ class MovieTranslateApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             self.sidebar,
             text="Movie Translate",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.grid(row=0, column=0, padx=20, pady=(20, 10))
         
@@ -80,7 +186,7 @@ class MovieTranslateApp(ctk.CTk):
         subtitle_label = ctk.CTkLabel(
             self.sidebar,
             text="电影翻译配音工具",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
         subtitle_label.grid(row=1, column=0, padx=20, pady=(0, 20))
         
@@ -95,21 +201,21 @@ class MovieTranslateApp(ctk.CTk):
         project_label = ctk.CTkLabel(
             self.project_frame,
             text="项目信息",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         project_label.grid(row=0, column=0, padx=10, pady=(10, 5))
         
         self.project_name_label = ctk.CTkLabel(
             self.project_frame,
             text="未创建项目",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.project_name_label.grid(row=1, column=0, padx=10, pady=5)
         
         self.project_status_label = ctk.CTkLabel(
             self.project_frame,
             text="状态: 就绪",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.project_status_label.grid(row=2, column=0, padx=10, pady=5)
         
@@ -120,7 +226,7 @@ class MovieTranslateApp(ctk.CTk):
         actions_label = ctk.CTkLabel(
             actions_frame,
             text="快速操作",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         actions_label.grid(row=0, column=0, padx=10, pady=(10, 5))
         
@@ -175,7 +281,7 @@ class MovieTranslateApp(ctk.CTk):
             width=200,
             state="disabled"
         )
-        self.export_btn.grid(row=6, column=0, padx=10, pady=5)
+        self.export_btn.grid(row=7, column=0, padx=10, pady=5)
         
         # Help button
         self.help_btn = ctk.CTkButton(
@@ -184,15 +290,15 @@ class MovieTranslateApp(ctk.CTk):
             command=self._show_help,
             width=200
         )
-        self.help_btn.grid(row=7, column=0, padx=10, pady=5)
+        self.help_btn.grid(row=8, column=0, padx=10, pady=5)
         
         # Version info
         version_label = ctk.CTkLabel(
             self.sidebar,
             text="v1.0.0",
-            font=ctk.CTkFont(size=10)
+            font=get_font(10)
         )
-        version_label.grid(row=8, column=0, padx=10, pady=(20, 10))
+        version_label.grid(row=9, column=0, padx=10, pady=(20, 10))
     
     def _create_main_content(self):
         """Create main content area"""
@@ -210,14 +316,14 @@ class MovieTranslateApp(ctk.CTk):
         self.step_title_label = ctk.CTkLabel(
             self.header_frame,
             text="欢迎使用 Movie Translate",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         self.step_title_label.grid(row=0, column=0, padx=20, pady=15, sticky="w")
         
         self.step_description_label = ctk.CTkLabel(
             self.header_frame,
             text="请创建新项目或打开现有项目开始",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
         self.step_description_label.grid(row=0, column=1, padx=20, pady=15, sticky="w")
         
@@ -228,6 +334,7 @@ class MovieTranslateApp(ctk.CTk):
         self.content_frame.grid_columnconfigure(0, weight=1)
         
         # Progress display
+        from movie_translate.ui.progress_display import ProgressDisplay
         self.progress_display = ProgressDisplay(self.main_content)
         self.progress_display.grid(row=2, column=0, sticky="ew", padx=20, pady=(0, 10))
         self.progress_display.hide()
@@ -240,10 +347,11 @@ class MovieTranslateApp(ctk.CTk):
         self.status_bar.grid_columnconfigure(1, weight=1)
         
         # Status text
+        self._status_text = "就绪"
         self.status_label = ctk.CTkLabel(
             self.status_bar,
             text="就绪",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.status_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
         
@@ -251,84 +359,206 @@ class MovieTranslateApp(ctk.CTk):
         self.connection_status_label = ctk.CTkLabel(
             self.status_bar,
             text="API: 未连接",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color="gray"
         )
         self.connection_status_label.grid(row=0, column=1, padx=10, pady=5, sticky="e")
         
-        # Progress bar
-        self.progress_bar = ttk.Progressbar(
-            self.status_bar,
-            mode='determinate',
-            length=200
-        )
-        self.progress_bar.grid(row=0, column=2, padx=10, pady=5)
-        self.progress_bar['value'] = 0
+        # Progress bar (only gridded while an operation is running)
+        self.progress_bar = ctk.CTkProgressBar(self.status_bar, width=200)
+        self.progress_bar.set(0)
+        self._last_progress_fraction = 0.0
+        self._status_progress_visible = False
+        self._status_progress_animating = False
     
     def _initialize_components(self):
         """Initialize UI components"""
+        from movie_translate.api.client import APIClient, ProjectManager
+        
         # Initialize basic managers early
         self.api_client = APIClient()
         self.project_manager = ProjectManager(self.api_client)
         
-        # Setup async event loop early
+        # Setup async loop early
         self._setup_async_loop()
         
-        # Initialize all frames
+        # Step frames are created on first use; factories are in step order
+        self._frame_factories = {
+            'file_import': self._create_file_import_frame,
+            'character_manager': self._create_character_manager_frame,
+        }
         self.frames = {}
+        self._step_frame_names = tuple(self._frame_factories)
         
-        # Create frames for each step
-        self.frames['file_import'] = FileImportFrame(self.content_frame, self)
-        self.frames['character_manager'] = CharacterManagerFrame(self.content_frame, self)
-        
-        # Hide all frames initially
-        for frame in self.frames.values():
-            frame.grid_remove()
+        # Step frames are stacked over each other in the content area and
+        # switched by raising; this blank frame covers steps without a frame
+        self._blank_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self._blank_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self._active_frame = self._blank_frame
+    
+    def _create_file_import_frame(self):
+        """Create the file import step frame"""
+        from movie_translate.ui.file_import import FileImportFrame
+        return FileImportFrame(self.content_frame, self)
+    
+    def _create_character_manager_frame(self):
+        """Create the character manager step frame"""
+        from movie_translate.ui.character_manager import CharacterManagerFrame
+        return CharacterManagerFrame(self.content_frame, self)
+    
+    def _get_frame(self, frame_name: str):
+        """Get a step frame, creating it on first use"""
+        frame = self.frames.get(frame_name)
+        if frame is None:
+            frame = self.frames[frame_name] = self._frame_factories[frame_name]()
+            frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+            frame.lower()
+        return frame
     
     def _setup_async_loop(self):
         """Setup async event loop for the application"""
-        self.async_loop = asyncio.new_event_loop()
+        # Prefer uvloop's lower per-callback overhead when it is installed;
+        # the default loop (Proactor on Windows) is used otherwise
+        try:
+            import uvloop
+        except ImportError:  # Not available on Windows
+            self.async_loop = asyncio.new_event_loop()
+        else:
+            self.async_loop = uvloop.new_event_loop()
+        
+        loop_started = threading.Event()
         
         def run_async_loop():
             asyncio.set_event_loop(self.async_loop)
+            self.async_loop.call_soon(loop_started.set)
             self.async_loop.run_forever()
         
         self.async_thread = threading.Thread(target=run_async_loop, daemon=True)
         self.async_thread.start()
         
-        # Schedule connection check
-        self.after(1000, self._check_api_connection)
+        # Wait until the loop is running so run_async can be used immediately
+        loop_started.wait(timeout=2.0)
+        
+        # Open the API client's pooled session on the async loop
+        self.post_async(self.api_client.startup())
+        
+        # Initialize the database off the Tk thread while the UI starts up
+        self._start_database_init()
+    
+    def _start_database_init(self):
+        """Initialize the database in a worker thread"""
+        def on_database_initialized(result, error):
+            # Run actions the user requested while initialization was running
+            pending_actions = self._db_pending_actions
+            self._db_pending_actions = []
+            
+            if error:
+                self._db_error = str(error)
+                logger.error(f"Failed to initialize database: {error}")
+                if pending_actions:
+                    logger.warning(f"Dropped {len(pending_actions)} actions waiting for the database")
+                self.set_status("数据库初始化失败")
+                messagebox.showerror("数据库错误", f"数据库初始化失败: {error}")
+                return
+            
+            logger.info("Database initialized successfully")
+            self.set_status("就绪")
+            for action in pending_actions:
+                action()
+        
+        async def init_database():
+            from movie_translate.models import initialize_database
+            await asyncio.get_running_loop().run_in_executor(None, initialize_database)
+        
+        logger.info("Initializing database...")
+        self.set_status("数据库初始化中…")
+        self._db_future = self.run_async(init_database(), on_database_initialized)
+        if self._db_future is None:
+            # Initialization never started; run_async reports why to the callback
+            self._db_error = "异步系统未就绪"
+    
+    def _database_ready(self, action) -> bool:
+        """Check that database initialization has finished
+        
+        If it is still running, action is queued to run once it succeeds (at
+        most once, however often the user retries) and False is returned.
+        If it failed or never started, the user is told and False is returned.
+        """
+        future = self._db_future
+        if self._db_error is None and future is not None:
+            if not future.done():
+                if action not in self._db_pending_actions:
+                    self._db_pending_actions.append(action)
+                self.set_status("数据库初始化中…完成后将继续操作")
+                return False
+            
+            # The result callback may not have run yet
+            if future.exception() is None:
+                return True
+            self._db_error = str(future.exception())
+        
+        messagebox.showerror("数据库错误", f"数据库不可用: {self._db_error or '未初始化'}")
+        return False
+    
+    def _schedule_connection_check(self, delay_ms: int):
+        """Schedule the next API health check, replacing any pending one"""
+        if self._health_check_id is not None:
+            self.after_cancel(self._health_check_id)
+        self._health_check_id = self.after(delay_ms, self._check_api_connection)
     
     def _check_api_connection(self):
         """Check API connection status"""
+        self._health_check_id = None
+        
+        # Any recent API response already proves the connection; skip the probe
+        last_response_time = self.api_client.last_response_time
+        if last_response_time is not None:
+            idle_ms = int((time.monotonic() - last_response_time) * 1000)
+            if idle_ms < self.HEALTH_CHECK_MAX_INTERVAL_MS:
+                self._update_connection_status(True)
+                self._health_check_delay_ms = self.HEALTH_CHECK_INTERVAL_MS
+                self._schedule_connection_check(self.HEALTH_CHECK_MAX_INTERVAL_MS - idle_ms)
+                return
+        
         def on_connection_result(result, error):
             if error:
                 logger.warning(f"API connection failed: {error}")
                 self._update_connection_status(False)
+                delay_ms = self._health_check_delay_ms
+                # Back off while the API is unreachable
+                self._health_check_delay_ms = min(
+                    delay_ms * 2, self.HEALTH_CHECK_MAX_INTERVAL_MS
+                )
             else:
                 self._update_connection_status(True)
+                self._health_check_delay_ms = self.HEALTH_CHECK_INTERVAL_MS
+                delay_ms = self.HEALTH_CHECK_MAX_INTERVAL_MS
+            
+            self._schedule_connection_check(delay_ms)
         
         async def check_connection():
-            try:
-                # Create a session for this check
-                async with self.api_client:
-                    return await self.api_client.health_check()
-            except Exception as e:
-                raise e
+            return await self.api_client.health_check()
         
         self.run_async(check_connection(), on_connection_result)
-        # Check every 30 seconds
-        self.after(30000, self._check_api_connection)
     
     def _update_connection_status(self, connected: bool):
         """Update connection status display"""
+        if connected == self._last_connection_state:
+            return
+        
         if connected:
             self.connection_status_label.configure(text="API: 已连接", text_color="green")
         else:
             self.connection_status_label.configure(text="API: 未连接", text_color="red")
+        
+        self._last_connection_state = connected
     
     def run_async(self, coro, callback=None):
-        """Run async coroutine from main thread without blocking"""
+        """Run async coroutine from main thread without blocking
+        
+        Returns the concurrent future for the task, or None if the async
+        loop is not running.
+        """
         if not self.async_loop or not self.async_loop.is_running():
             # If async loop is not ready, show error message
             logger.warning("Async loop not ready, showing error message")
@@ -336,29 +566,127 @@ class MovieTranslateApp(ctk.CTk):
                 self.after(0, lambda: callback(None, Exception("异步系统未就绪，请稍后再试")))
             else:
                 logger.error("Async loop not ready when trying to run task")
+            coro.close()
+            return None
+        
+        future = asyncio.run_coroutine_threadsafe(coro, self.async_loop)
+        # Runs on the async thread; the result is read on the Tk thread
+        future.add_done_callback(lambda f: self.call_in_ui(self._on_async_done, f, callback))
+        return future
+    
+    def post_async(self, coro) -> bool:
+        """Run async coroutine in the background without reporting its result
+        
+        Cheaper than run_async when the caller does not need the outcome: no
+        concurrent future or Tk callback is created, and failures are only
+        logged. Returns False if the async loop is not running.
+        """
+        if not self.async_loop or not self.async_loop.is_running():
+            logger.error("Async loop not ready when trying to run task")
+            coro.close()
+            return False
+        
+        self.async_loop.call_soon_threadsafe(self._start_background_task, coro)
+        return True
+    
+    def _start_background_task(self, coro):
+        """Start a fire-and-forget task (runs on the async thread)"""
+        task = self.async_loop.create_task(coro)
+        # Keep a reference so the task is not garbage collected while running
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+    
+    def _on_background_task_done(self, task):
+        """Log failures of fire-and-forget tasks (runs on the async thread)"""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task failed: {task.exception()}")
+    
+    def call_in_ui(self, fn, *args, **kwargs):
+        """Schedule a UI call on the Tk thread (safe to call from the async thread)
+        
+        deque append/popleft are atomic, so no lock is taken. A drain is only
+        scheduled when the queue goes from empty to non-empty; calls queued
+        while one is pending ride along with it and make no Tcl call.
+        """
+        self._ui_queue.append((fn, args, kwargs))
+        if self._ui_drain_armed:
             return
         
-        def on_complete(future):
+        self._ui_drain_armed = True
+        try:
+            self.after(0, self._drain_ui_queue)
+        except (RuntimeError, tk.TclError):
+            # The window is gone; nothing is left to run the call
+            pass
+    
+    def _drain_ui_queue(self):
+        """Run every queued UI call on the Tk thread"""
+        # Disarm before draining so a call queued from here on schedules a
+        # new drain instead of being left behind
+        self._ui_drain_armed = False
+        
+        ui_queue = self._ui_queue
+        while True:
             try:
-                result = future.result()
-                if callback:
-                    self.after(0, lambda: callback(result, None))
+                fn, args, kwargs = ui_queue.popleft()
+            except IndexError:
+                break
+            
+            try:
+                fn(*args, **kwargs)
             except Exception as e:
-                if callback:
-                    self.after(0, lambda: callback(None, e))
-                else:
-                    logger.error(f"Async task failed: {e}")
+                logger.error(f"UI callback failed: {e}")
+    
+    def _on_async_done(self, future, callback=None):
+        """Deliver a finished async task's result to its callback on the Tk thread"""
+        # Tasks are only cancelled on shutdown; there is no one left to notify
+        if future.cancelled():
+            return
         
-        future = asyncio.run_coroutine_threadsafe(coro, self.async_loop)
-        future.add_done_callback(on_complete)
+        try:
+            result = future.result()
+        except Exception as e:
+            if callback:
+                callback(None, e)
+            else:
+                logger.error(f"Async task failed: {e}")
+            return
+        
+        if callback:
+            callback(result, None)
     
     def _new_project(self):
         """Create new project"""
+        if not self._database_ready(self._new_project):
+            return
+        
+        # The dialog is built once and hidden between uses
+        if self._new_project_dialog is None:
+            self._create_new_project_dialog()
+        else:
+            self._new_project_name_entry.delete(0, "end")
+            self._new_project_media_path.set("")
+            self._new_project_lang_var.set("zh")
+        
+        dialog = self._new_project_dialog
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        self._new_project_name_entry.focus_set()
+    
+    def _hide_new_project_dialog(self):
+        """Hide the new project dialog for reuse"""
+        self._new_project_dialog.grab_release()
+        self._new_project_dialog.withdraw()
+    
+    def _create_new_project_dialog(self):
+        """Build the new project dialog"""
         dialog = ctk.CTkToplevel(self)
         dialog.title("新建项目")
         dialog.geometry("800x300")
         dialog.transient(self)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_new_project_dialog)
         
         # Project name
         name_label = ctk.CTkLabel(dialog, text="项目名称:")
@@ -378,12 +706,7 @@ class MovieTranslateApp(ctk.CTk):
         def browse_media():
             file_path = filedialog.askopenfilename(
                 title="选择媒体文件",
-                filetypes=[
-                    ("所有媒体文件", "*.mp4 *.avi *.mkv *.mov *.wmv *.flv *.webm *.mp3 *.wav *.flac *.aac *.ogg *.m4a *.wma"),
-                    ("视频文件", "*.mp4 *.avi *.mkv *.mov *.wmv *.flv *.webm"),
-                    ("音频文件", "*.mp3 *.wav *.flac *.aac *.ogg *.m4a *.wma"),
-                    ("所有文件", "*.*")
-                ]
+                filetypes=_MEDIA_FILETYPES
             )
             if file_path:
                 media_path.set(file_path)
@@ -424,7 +747,7 @@ class MovieTranslateApp(ctk.CTk):
                     self.current_project = result
                     self._update_project_display()
                     self._navigate_to_step(0)
-                    dialog.destroy()
+                    self._hide_new_project_dialog()
             
             async def create():
                 return await self.project_manager.create_new_project(
@@ -438,11 +761,18 @@ class MovieTranslateApp(ctk.CTk):
         create_btn = ctk.CTkButton(button_frame, text="创建", command=create_project)
         create_btn.grid(row=0, column=0, padx=10)
         
-        cancel_btn = ctk.CTkButton(button_frame, text="取消", command=dialog.destroy)
+        cancel_btn = ctk.CTkButton(button_frame, text="取消", command=self._hide_new_project_dialog)
         cancel_btn.grid(row=0, column=1, padx=10)
+        
+        self._new_project_dialog = dialog
+        self._new_project_name_entry = name_entry
+        self._new_project_media_path = media_path
+        self._new_project_lang_var = lang_var
     
     def _open_recovery_dialog(self):
         """Open recovery management dialog"""
+        from movie_translate.ui.recovery_dialog import show_recovery_dialog
+        
         try:
             show_recovery_dialog(self)
         except Exception as e:
@@ -451,18 +781,18 @@ class MovieTranslateApp(ctk.CTk):
     
     def _open_project(self):
         """Open existing project"""
+        if not self._database_ready(self._open_project):
+            return
+        
         file_path = filedialog.askopenfilename(
             title="打开项目",
-            filetypes=[
-                ("项目文件", "*.json"),
-                ("所有文件", "*.*")
-            ]
+            filetypes=_PROJECT_FILETYPES
         )
         
         if file_path:
             def on_project_opened(result, error):
                 if error:
-                    messagebox.showerror("错误", f"打开项目失败: {error}")
+                    self._toast("error", f"打开项目失败: {error}")
                 else:
                     self.current_project = result
                     self._update_project_display()
@@ -474,31 +804,33 @@ class MovieTranslateApp(ctk.CTk):
             self.run_async(open_project(), on_project_opened)
     
     def _save_project(self):
-        """Save current project"""
+        """Save current project
+        
+        Returns the future for the save, or None if nothing was saved.
+        """
         if not self.current_project:
-            return
+            return None
         
         file_path = filedialog.asksaveasfilename(
             title="保存项目",
             defaultextension=".json",
-            filetypes=[
-                ("项目文件", "*.json"),
-                ("所有文件", "*.*")
-            ]
+            filetypes=_PROJECT_FILETYPES
         )
         
         if file_path:
             def on_project_saved(result, error):
                 if error:
-                    messagebox.showerror("错误", f"保存项目失败: {error}")
+                    self._toast("error", f"保存项目失败: {error}")
                 else:
-                    messagebox.showinfo("成功", "项目保存成功")
+                    self._toast("info", "项目保存成功")
             
             async def save_project():
-                await self.project_manager.save_project(file_path)
+                await self.project_manager.save_project(file_path, self.current_project)
                 return True
             
-            self.run_async(save_project(), on_project_saved)
+            return self.run_async(save_project(), on_project_saved)
+        
+        return None
     
     def _export_video(self):
         """Export final video"""
@@ -509,26 +841,22 @@ class MovieTranslateApp(ctk.CTk):
         file_path = filedialog.asksaveasfilename(
             title="导出视频",
             defaultextension=".mp4",
-            filetypes=[
-                ("MP4文件", "*.mp4"),
-                ("AVI文件", "*.avi"),
-                ("所有文件", "*.*")
-            ]
+            filetypes=_EXPORT_FILETYPES
         )
         
         if file_path:
             def on_video_exported(result, error):
                 if error:
-                    self.progress_display.hide()
-                    messagebox.showerror("错误", f"导出视频失败: {error}")
+                    self.hide_progress()
+                    self._toast("error", f"导出视频失败: {error}")
                 else:
-                    self.progress_display.update_progress(100, "导出完成")
-                    messagebox.showinfo("成功", f"视频导出成功: {file_path}")
-                    self.progress_display.hide()
+                    self.update_progress(100, "导出完成")
+                    self.hide_progress()
+                    self._toast("info", f"视频导出成功: {file_path}")
             
             async def export_video():
-                self.progress_display.show("正在导出视频...")
-                self.progress_display.update_progress(0, "开始导出")
+                self.call_in_ui(self.show_progress, "正在导出视频...")
+                self.call_in_ui(self.update_progress, 0, "开始导出")
                 
                 # Export video using API
                 result = await self.project_manager.export_video(file_path)
@@ -536,8 +864,41 @@ class MovieTranslateApp(ctk.CTk):
             
             self.run_async(export_video(), on_video_exported)
     
+    def _toast(self, kind: str, text: str):
+        """Show a short notification in the corner of the main content
+        
+        Unlike a message box this does not block the Tk loop; it hides
+        itself after TOAST_DURATION_MS. kind is "info" or "error".
+        """
+        if self._toast_frame is None:
+            self._toast_frame = ctk.CTkFrame(self.main_content, corner_radius=8)
+            self._toast_label = ctk.CTkLabel(
+                self._toast_frame,
+                text="",
+                font=get_font(12),
+                text_color="white",
+                wraplength=400
+            )
+            self._toast_label.grid(row=0, column=0, padx=15, pady=10)
+        
+        self._toast_frame.configure(fg_color=self.TOAST_COLORS[kind])
+        self._toast_label.configure(text=text)
+        self._toast_frame.place(relx=1.0, rely=1.0, x=-20, y=-20, anchor="se")
+        self._toast_frame.lift()
+        
+        if self._toast_hide_id is not None:
+            self.after_cancel(self._toast_hide_id)
+        self._toast_hide_id = self.after(self.TOAST_DURATION_MS, self._hide_toast)
+    
+    def _hide_toast(self):
+        """Hide the notification shown by _toast"""
+        self._toast_hide_id = None
+        self._toast_frame.place_forget()
+    
     def _open_settings(self):
         """Open settings dialog"""
+        from movie_translate.ui.settings_panel import SettingsPanel
+        
         settings_dialog = SettingsPanel(self)
         settings_dialog.grab_set()
     
@@ -580,56 +941,107 @@ Movie Translate 使用指南
     
     def _navigate_to_step(self, step_index: int):
         """Navigate to specific step"""
-        self.current_step = step_index
+        # Raise current step frame above the others (no geometry changes)
+        if step_index < len(self._step_frame_names):
+            frame = self._get_frame(self._step_frame_names[step_index])
+        else:
+            frame = self._blank_frame
         
-        # Hide all frames
-        for frame in self.frames.values():
-            frame.grid_remove()
+        # Navigating to the step already shown only needs the navigator synced
+        if frame is self._active_frame and step_index == self.current_step:
+            self.step_navigator.set_current_step(step_index)
+            return
         
-        # Show current step frame
-        step_frames = ['file_import', 'character_manager']
-        if step_index < len(step_frames):
-            current_frame = self.frames[step_frames[step_index]]
-            current_frame.grid(row=0, column=0, sticky="nsew")
+        self.current_step = step_index
+        if frame is not self._active_frame:
+            frame.lift()
+            self._active_frame = frame
         
         # Update step navigator
         self.step_navigator.set_current_step(step_index)
         
         # Update header
-        step_titles = [
-            "文件导入",
-            "角色管理",
-            "语音识别",
-            "翻译处理",
-            "声音克隆",
-            "视频合成"
-        ]
-        
-        step_descriptions = [
-            "导入视频文件和相关资料",
-            "识别和管理配音角色",
-            "自动识别视频中的语音内容",
-            "翻译识别到的文本内容",
-            "为角色生成克隆声音",
-            "合成最终的视频文件"
-        ]
-        
-        if step_index < len(step_titles):
-            self.step_title_label.configure(text=f"步骤 {step_index + 1}: {step_titles[step_index]}")
-            self.step_description_label.configure(text=step_descriptions[step_index])
+        if step_index < len(self.STEP_HEADERS):
+            self.step_title_label.configure(text=self.STEP_HEADERS[step_index])
+            self.step_description_label.configure(text=self.STEP_DESCRIPTIONS[step_index])
     
     def set_status(self, text: str):
         """Set status bar text"""
-        self.status_label.configure(text=text)
+        self._queue_status_update('status', text)
+    
+    def _queue_status_update(self, key: str, value):
+        """Record a status bar change, applying only the latest per flush"""
+        self._pending_status_updates[key] = value
+        if self._status_flush_id is None:
+            self._status_flush_id = self.after(
+                self.STATUS_FLUSH_INTERVAL_MS, self._flush_status_updates
+            )
+    
+    def _flush_status_updates(self):
+        """Apply pending status bar changes with one configure per widget"""
+        self._status_flush_id = None
+        pending = self._pending_status_updates
+        self._pending_status_updates = {}
+        
+        text = pending.get('status')
+        if text is not None and text != self._status_text:
+            self._status_text = text
+            self.status_label.configure(text=text)
+        
+        if 'progress' in pending:
+            self.progress_bar.set(pending['progress'])
     
     def set_progress(self, value: int, maximum: int = 100):
         """Set progress bar value"""
-        self.progress_bar['maximum'] = maximum
-        self.progress_bar['value'] = value
+        fraction = max(0.0, min(1.0, value / maximum)) if maximum else 0.0
+        
+        # The first real value replaces the busy animation
+        if self._status_progress_animating:
+            self._stop_status_animation()
+            self._last_progress_fraction = None
+        
+        # Skip redraws for changes under 1%, but always land on 0% and 100%
+        if self._last_progress_fraction is not None and (
+            fraction == self._last_progress_fraction or (
+                abs(fraction - self._last_progress_fraction) < 0.01 and 0.0 < fraction < 1.0
+            )
+        ):
+            return
+        
+        self._last_progress_fraction = fraction
+        self._queue_status_update('progress', fraction)
+        self._show_status_progress()
+    
+    def _show_status_progress(self):
+        """Show the status bar progress bar"""
+        if not self._status_progress_visible:
+            self.progress_bar.grid(row=0, column=2, padx=10, pady=5)
+            self._status_progress_visible = True
+    
+    def _hide_status_progress(self):
+        """Hide the status bar progress bar while idle"""
+        self._stop_status_animation()
+        if self._status_progress_visible:
+            self.progress_bar.grid_remove()
+            self._status_progress_visible = False
+    
+    def _stop_status_animation(self):
+        """Stop the busy animation and return the bar to determinate mode"""
+        if self._status_progress_animating:
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode="determinate")
+            self._status_progress_animating = False
     
     def show_progress(self, title: str, description: str = ""):
         """Show progress display"""
         self.progress_display.show(title, description)
+        
+        # Animate the status bar until the operation reports a value
+        if not self._status_progress_animating:
+            self.progress_bar.configure(mode="indeterminate")
+            self.progress_bar.start()
+            self._status_progress_animating = True
+        self._show_status_progress()
     
     def update_progress(self, value: int, status: str = ""):
         """Update progress display"""
@@ -638,9 +1050,18 @@ Movie Translate 使用指南
     def hide_progress(self):
         """Hide progress display"""
         self.progress_display.hide()
+        self._hide_status_progress()
     
     def on_closing(self):
-        """Handle application closing"""
+        """Handle application closing
+        
+        The Tk loop keeps running while the async loop shuts down, so nothing
+        here waits on the async thread and its queued callbacks still run.
+        """
+        if self._closing:
+            return
+        
+        project_save = None
         if self.current_project:
             result = messagebox.askyesnocancel(
                 "保存项目",
@@ -648,32 +1069,76 @@ Movie Translate 使用指南
             )
             
             if result is True:  # Save
-                self._save_project()
+                project_save = self._save_project()
             elif result is None:  # Cancel
                 return
         
-        # Save current state before closing
-        self._save_current_state()
+        self._closing = True
+        self.withdraw()
         
-        # Stop interrupt recovery
-        self._stop_interrupt_recovery()
+        # Save current state before closing (written in the background)
+        state_save = self._save_current_state(wait=True)
         
-        # Clean up async loop
+        if self.async_loop and self.async_loop.is_running():
+            # The saves are awaited on the loop before other tasks are cancelled
+            pending = [future for future in (project_save, state_save) if future is not None]
+            shutdown = asyncio.run_coroutine_threadsafe(
+                self._shutdown_async(pending), self.async_loop
+            )
+            self._wait_for_shutdown(shutdown, time.monotonic() + self.CLOSE_TIMEOUT)
+        else:
+            self._finish_closing()
+    
+    def _wait_for_shutdown(self, shutdown, deadline: float):
+        """Poll the async shutdown from the Tk loop, then finish closing"""
+        if not shutdown.done():
+            if time.monotonic() < deadline:
+                self.after(self.SHUTDOWN_POLL_INTERVAL_MS, self._wait_for_shutdown, shutdown, deadline)
+                return
+            logger.warning("Timed out shutting down async tasks")
+        elif shutdown.exception() is not None:
+            logger.warning(f"Failed to shut down async tasks cleanly: {shutdown.exception()}")
+        
+        self._finish_closing()
+    
+    def _finish_closing(self):
+        """Stop the async loop and interrupt recovery, then destroy the window"""
         if self.async_loop and self.async_loop.is_running():
             self.async_loop.call_soon_threadsafe(self.async_loop.stop)
         
-        # Wait for async thread to finish
+        # Stop interrupt recovery
+        self._stop_interrupt_recovery()
+        
+        # The loop has nothing left to run, so the thread exits promptly
         if self.async_thread and self.async_thread.is_alive():
-            self.async_thread.join(timeout=2.0)
+            self.async_thread.join(timeout=0.2)
         
         self.destroy()
     
+    async def _shutdown_async(self, pending=()):
+        """Finish pending saves, cancel other tasks and close the API session (runs on the async loop)"""
+        if pending:
+            _, not_done = await asyncio.wait(
+                [asyncio.wrap_future(future) for future in pending],
+                timeout=self.CLOSE_SAVE_TIMEOUT
+            )
+            if not_done:
+                logger.warning("Failed to finish saving before closing")
+        
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        await self.api_client.close()
+    
     def _check_recovery(self):
         """Check for recovery data on startup"""
         try:
-            interrupt_recovery = get_interrupt_recovery()
-            
-            if interrupt_recovery.has_recovery_state():
+            if self._recovery.has_recovery_state():
+                from movie_translate.ui.recovery_dialog import show_recovery_dialog
+                
                 # Show recovery dialog
                 recovery_data = show_recovery_dialog(self)
                 
@@ -692,10 +1157,10 @@ Movie Translate 使用指南
                 
                 # Load project data into frames
                 if 'video_file' in self.current_project:
-                    self.frames['file_import'].set_video_file(self.current_project['video_file'])
+                    self._get_frame('file_import').set_video_file(self.current_project['video_file'])
                 
                 if 'characters' in self.current_project:
-                    self.frames['character_manager'].set_characters(self.current_project['characters'])
+                    self._get_frame('character_manager').set_characters(self.current_project['characters'])
                 
                 if 'current_step' in self.current_project:
                     self._navigate_to_step(self.current_project['current_step'])
@@ -704,36 +1169,59 @@ Movie Translate 使用指南
             if 'steps' in recovery_data:
                 for step_id, step_info in recovery_data['steps'].items():
                     step_index = int(step_id)
-                    if step_index < len(self.frames):
-                        frame_name = list(self.frames.keys())[step_index]
-                        if hasattr(self.frames[frame_name], 'load_step_data'):
-                            self.frames[frame_name].load_step_data(step_info['data'])
+                    if step_index < len(self._step_frame_names):
+                        frame = self._get_frame(self._step_frame_names[step_index])
+                        if hasattr(frame, 'load_step_data'):
+                            frame.load_step_data(step_info['data'])
             
             logger.info("Recovery data loaded successfully")
             
         except Exception as e:
             logger.error(f"Failed to load recovery data: {e}")
     
-    def _save_current_state(self):
-        """Save current application state for recovery"""
+    def _save_current_state(self, wait: bool = False):
+        """Save current application state for recovery
+        
+        State is collected on the Tk thread and the recovery file is written
+        on a worker thread. With wait=True, returns the future for the write
+        (or None if nothing was scheduled) so the caller can wait for it;
+        otherwise the write is fire-and-forget and None is returned.
+        """
         try:
-            interrupt_recovery = get_interrupt_recovery()
-            
-            # Save project state
-            if self.current_project:
-                interrupt_recovery.update_project_state(self.current_project)
-            
-            # Save step states
-            for i, (frame_name, frame) in enumerate(self.frames.items()):
-                if hasattr(frame, 'get_step_data'):
+            # Collect step states (frames never opened have no state to save)
+            step_states = {}
+            for i, frame_name in enumerate(self._step_frame_names):
+                frame = self.frames.get(frame_name)
+                if frame is not None and hasattr(frame, 'get_step_data'):
                     step_data = frame.get_step_data()
                     if step_data:
-                        interrupt_recovery.update_step_state(i, step_data)
+                        step_states[i] = step_data
+            
+            project_data = dict(self.current_project) if self.current_project else None
+            self._recovery.update_state(project_data, step_states)
+            
+            # Only persist while auto-save is running
+            if not self._recovery.is_running:
+                return None
+            
+            snapshot = self._recovery.snapshot_state()
+            write = asyncio.to_thread(self._recovery.write_snapshot, snapshot)
+            future = None
+            if wait:
+                future = self.run_async(write)
+                scheduled = future is not None
+            else:
+                scheduled = self.post_async(write)
+            
+            if not scheduled:
+                self._recovery.write_snapshot(snapshot)
             
             logger.info("Current state saved for recovery")
+            return future
             
         except Exception as e:
             logger.error(f"Failed to save current state: {e}")
+            return None
     
     def create_checkpoint(self, checkpoint_name: str):
         """Create a named checkpoint"""
@@ -742,8 +1230,7 @@ Movie Translate 使用指南
             self._save_current_state()
             
             # Create checkpoint
-            interrupt_recovery = get_interrupt_recovery()
-            interrupt_recovery.create_checkpoint(checkpoint_name)
+            self._recovery.create_checkpoint(checkpoint_name)
             
             logger.info(f"Checkpoint '{checkpoint_name}' created")
             
@@ -753,8 +1240,7 @@ Movie Translate 使用指南
     def _start_interrupt_recovery(self):
         """Start interrupt recovery auto-save"""
         try:
-            interrupt_recovery = get_interrupt_recovery()
-            interrupt_recovery.start_auto_save()
+            self._recovery.start_auto_save()
             logger.info("Interrupt recovery auto-save started")
         except Exception as e:
             logger.error(f"Failed to start interrupt recovery: {e}")
@@ -762,14 +1248,8 @@ Movie Translate 使用指南
     def _initialize_heavy_components(self):
         """Initialize heavy components after UI is ready"""
         try:
-            # Initialize database
-            logger.info("Initializing database...")
-            try:
-                initialize_database()
-                logger.info("Database initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize database: {e}")
-                messagebox.showerror("数据库错误", f"数据库初始化失败: {e}")
+            # Database initialization already started in _setup_async_loop
+            logger.info("Database initialization running in background")
             
             # API client and project manager already initialized in _initialize_components
             logger.info("API client and project manager already initialized")
@@ -777,6 +1257,9 @@ Movie Translate 使用指南
             # Async event loop already initialized in _initialize_components
             logger.info("Async event loop already initialized")
             
+            # First API health check (non-blocking, reschedules itself)
+            self._check_api_connection()
+            
             # Start interrupt recovery
             logger.info("Starting interrupt recovery...")
             self._start_interrupt_recovery()
@@ -785,9 +1268,6 @@ Movie Translate 使用指南
             logger.info("Checking for recovery data...")
             self._check_recovery()
             
-            # Schedule connection check
-            self.after(2000, self._check_api_connection)
-            
             logger.info("Heavy components initialization completed")
             
         except Exception as e:
@@ -797,8 +1277,7 @@ Movie Translate 使用指南
     def _stop_interrupt_recovery(self):
         """Stop interrupt recovery auto-save"""
         try:
-            interrupt_recovery = get_interrupt_recovery()
-            interrupt_recovery.stop_auto_save()
+            self._recovery.stop_auto_save()
             logger.info("Interrupt recovery auto-save stopped")
         except Exception as e:
             logger.error(f"Failed to stop interrupt recovery: {e}")
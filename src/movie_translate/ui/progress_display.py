@@ -4,14 +4,32 @@ Progress display component for Movie Translate UI
 
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import threading
+import time
+from collections import deque
+
+from movie_translate.ui.fonts import get_font
 
 
 class ProgressDisplay(ctk.CTkFrame):
-    """Progress display component for showing operation progress"""
+    """Progress display component for showing operation progress
+    
+    Widget changes are batched and left to Tk's idle redraw. Do not call
+    update() (or update_idletasks()) from here: it re-enters the event
+    loop from inside update handlers and defeats the batching.
+    """
+    
+    # How often queued updates are applied while the display is shown; this
+    # is the only limit on how often progress is redrawn
+    DRAIN_INTERVAL_MS = 50
+    
+    # Subtask rows are built as they scroll into view: estimated row height
+    # and how many rows to build past the bottom of the viewport
+    SUBTASK_ROW_HEIGHT = 30
+    SUBTASK_RENDER_AHEAD = 5
     
     def __init__(self, parent):
         super().__init__(parent, fg_color=("gray95", "gray10"))
@@ -20,6 +38,38 @@ class ProgressDisplay(ctk.CTkFrame):
         self.start_time = None
         self.progress_tasks = []
         
+        # Subtask lookup by id and running totals for the overall progress
+        self._task_index: Dict[str, Dict[str, Any]] = {}
+        self._total_weight = 0.0
+        self._weighted_progress = 0.0
+        
+        # Subtasks changed since the last redraw, flushed together when idle
+        self._pending_subtasks: Dict[str, Dict[str, Any]] = {}
+        self._flush_scheduled = False
+        
+        # Status text of the most recent update_progress call
+        self._last_status = ""
+        # Filled pixel width last drawn on the main bar
+        self._main_bar_pixel = 0
+        
+        # Pending once-a-second elapsed/remaining time refresh
+        self._time_after_id = None
+        
+        # Text currently shown in status_label, to skip no-op configures
+        self._status_text = ""
+        
+        # Subtask row widgets kept for reuse after hide()
+        self._row_pool: List[Dict[str, Any]] = []
+        # Subtasks (in order) that have a row built
+        self._rendered_count = 0
+        self._row_render_scheduled = False
+        
+        # Updates may come from worker threads; they are queued here and
+        # applied on the Tk thread by _drain. deque append/popleft are
+        # atomic, so no lock is needed for many producers and one consumer
+        self._msg_q = deque()
+        self._drain_id = None
+        
         self._create_ui()
         self.hide()
     
@@ -37,23 +87,28 @@ class ProgressDisplay(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self.main_frame,
             text="",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         self.title_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
         
+        # Status text and percentage change often, so they are bound to
+        # variables and updated with var.set() rather than configure()
+        self.status_var = tk.StringVar(self, value="")
+        self.percent_var = tk.StringVar(self, value="0%")
+        
         # Status text
         self.status_label = ctk.CTkLabel(
             self.main_frame,
-            text="",
-            font=ctk.CTkFont(size=12)
+            textvariable=self.status_var,
+            font=get_font(12)
         )
         self.status_label.grid(row=0, column=1, padx=10, pady=5, sticky="w")
         
         # Progress percentage
         self.percent_label = ctk.CTkLabel(
             self.main_frame,
-            text="0%",
-            font=ctk.CTkFont(size=12)
+            textvariable=self.percent_var,
+            font=get_font(12)
         )
         self.percent_label.grid(row=0, column=2, padx=10, pady=5, sticky="e")
         
@@ -67,6 +122,23 @@ class ProgressDisplay(ctk.CTkFrame):
         self.subtasks_frame.grid(row=1, column=0, columnspan=3, sticky="nsew", padx=10, pady=5)
         self.subtasks_frame.grid_columnconfigure(1, weight=1)
         
+        # Build further subtask rows when the list is resized or scrolled.
+        # CTkScrollableFrame does not expose its canvas publicly, so this
+        # reads the private _parent_canvas/_scrollbar (present in 5.2 to 6.x;
+        # customtkinter is capped below 7 in requirements.txt). If they go
+        # away, every row is built up front instead
+        canvas = getattr(self.subtasks_frame, '_parent_canvas', None)
+        scrollbar = getattr(self.subtasks_frame, '_scrollbar', None)
+        if canvas is not None and scrollbar is not None:
+            scrollbar_set = scrollbar.set
+            canvas.configure(
+                yscrollcommand=lambda first, last: (scrollbar_set(first, last), self._schedule_row_render())
+            )
+            canvas.bind("<Configure>", lambda event: self._schedule_row_render(), add="+")
+            self._subtasks_canvas = canvas
+        else:
+            self._subtasks_canvas = None
+        
         # Action buttons
         self.actions_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.actions_frame.grid(row=2, column=0, columnspan=3, sticky="ew", padx=10, pady=5)
@@ -106,6 +178,7 @@ class ProgressDisplay(ctk.CTkFrame):
             'title': title,
             'description': description,
             'start_time': datetime.now(),
+            'start_monotonic': time.monotonic(),
             'progress': 0,
             'status': 'running',
             'paused': False,
@@ -113,9 +186,11 @@ class ProgressDisplay(ctk.CTkFrame):
         }
         
         self.title_label.configure(text=title)
-        self.status_label.configure(text=description or "准备中...")
-        self.percent_label.configure(text="0%")
+        self._set_status_text(description or "准备中...")
+        self.percent_var.set("0%")
         self.progress_bar.set(0)
+        self._main_bar_pixel = 0
+        self._last_status = ""
         
         # Enable buttons
         self.cancel_btn.configure(state="normal")
@@ -126,38 +201,102 @@ class ProgressDisplay(ctk.CTkFrame):
         
         # Start time updates
         self._update_time_display()
+        
+        # Start applying queued updates; anything queued while hidden
+        # belonged to an earlier operation
+        self._msg_q.clear()
+        if self._drain_id is None:
+            self._drain()
     
     def hide(self):
         """Hide progress display"""
+        # Stop the periodic drain, but apply what is already queued so a
+        # final update_progress(100) just before hide() still lands
+        if self._drain_id is not None:
+            self.after_cancel(self._drain_id)
+            self._drain_id = None
+        self._apply_queued()
+        
         self.grid_remove()
         self.current_operation = None
-        self.progress_tasks.clear()
+        self._pending_subtasks.clear()
+        self._cancel_time_display()
         
-        # Clear subtasks
-        for widget in self.subtasks_frame.winfo_children():
-            widget.destroy()
+        # Keep subtask rows for the next operation instead of destroying them
+        for task in self.progress_tasks:
+            ui = task.get('ui')
+            if ui is not None:
+                ui['frame'].grid_remove()
+                self._row_pool.append(ui)
+        self.progress_tasks.clear()
+        self._task_index.clear()
+        self._rendered_count = 0
+        self._total_weight = 0.0
+        self._weighted_progress = 0.0
+    
+    def _drain(self):
+        """Apply all queued updates, then check again after DRAIN_INTERVAL_MS"""
+        self._apply_queued()
+        self._drain_id = self.after(self.DRAIN_INTERVAL_MS, self._drain)
+    
+    def _apply_queued(self):
+        """Apply all queued updates on the Tk thread"""
+        msg_q = self._msg_q
+        while True:
+            try:
+                apply, args = msg_q.popleft()
+            except IndexError:
+                break
+            apply(*args)
     
     def update_progress(self, value: int, status: str = ""):
-        """Update main progress"""
+        """Update main progress (safe to call from any thread)"""
+        self._msg_q.append((self._apply_progress, (value, status)))
+    
+    def _apply_progress(self, value: int, status: str = ""):
+        """Apply a main progress update"""
         if not self.current_operation:
             return
         
         # Clamp value between 0 and 100
         value = max(0, min(100, value))
         
-        self.current_operation['progress'] = value
-        self.progress_bar.set(value / 100)
-        self.percent_label.configure(text=f"{value}%")
+        # Repeats of the last update change nothing
+        if value == self.current_operation['progress'] and (not status or status == self._last_status):
+            return
         
+        self.current_operation['progress'] = value
         if status:
-            self.status_label.configure(text=status)
+            self._last_status = status
+        
+        self._paint_main(status)
         
         # Check if completed
         if value >= 100:
             self._on_operation_completed()
     
+    def _paint_main(self, status: str = ""):
+        """Redraw the main progress bar with the current value and status"""
+        value = self.current_operation['progress']
+        
+        # Only redraw the bar when the filled width moves by a whole pixel
+        # (before the bar is laid out its width is 1, so always redraw then)
+        bar_width = self.progress_bar.winfo_width()
+        pixel = value * bar_width // 100
+        if pixel != self._main_bar_pixel or value >= 100 or bar_width <= 1:
+            self._main_bar_pixel = pixel
+            self.progress_bar.set(value / 100)
+        self.percent_var.set(f"{value}%")
+        
+        if status:
+            self._set_status_text(status)
+    
     def add_subtask(self, task_id: str, title: str, weight: float = 1.0):
-        """Add a subtask to track"""
+        """Add a subtask to track (safe to call from any thread)"""
+        self._msg_q.append((self._apply_add_subtask, (task_id, title, weight)))
+    
+    def _apply_add_subtask(self, task_id: str, title: str, weight: float = 1.0):
+        """Add a subtask and create its row"""
         if not self.current_operation:
             return
         
@@ -170,25 +309,55 @@ class ProgressDisplay(ctk.CTkFrame):
         }
         
         self.progress_tasks.append(task)
-        self._create_subtask_ui(task)
+        self._task_index[task_id] = task
+        self._total_weight += weight
+        self._schedule_row_render()
     
     def update_subtask(self, task_id: str, progress: int, status: str = ""):
-        """Update subtask progress"""
+        """Update subtask progress (safe to call from any thread)"""
+        self._msg_q.append((self._apply_subtask, (task_id, progress, status)))
+    
+    def _apply_subtask(self, task_id: str, progress: int, status: str = ""):
+        """Apply a subtask update"""
         if not self.current_operation:
             return
         
-        # Find and update task
-        for task in self.progress_tasks:
-            if task['id'] == task_id:
-                task['progress'] = max(0, min(100, progress))
-                task['status'] = status or 'running'
-                
-                # Update UI
-                self._update_subtask_ui(task)
-                
-                # Update overall progress
-                self._update_overall_progress()
-                break
+        task = self._task_index.get(task_id)
+        if task is None:
+            return
+        
+        new_progress = 0 if progress < 0 else 100 if progress > 100 else progress
+        new_status = status or 'running'
+        old_progress = task['progress']
+        
+        # The indicator and title only need redrawing when the status text
+        # changes or the task crosses completion
+        if new_status != task['status'] or (new_progress >= 100) != (old_progress >= 100):
+            task['_status_changed'] = True
+        
+        self._weighted_progress += (new_progress - old_progress) * task['weight']
+        task['progress'] = new_progress
+        task['status'] = new_status
+        
+        # The UI is redrawn once for a burst of updates
+        self._pending_subtasks[task_id] = task
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_pending)
+    
+    def _flush_pending(self):
+        """Redraw subtasks updated since the last flush and the overall progress"""
+        self._flush_scheduled = False
+        if not self._pending_subtasks:
+            return
+        
+        pending = self._pending_subtasks
+        update_subtask_ui = self._update_subtask_ui
+        for task in pending.values():
+            update_subtask_ui(task)
+        pending.clear()
+        
+        self._update_overall_progress()
     
     def complete_subtask(self, task_id: str):
         """Mark subtask as completed"""
@@ -198,9 +367,53 @@ class ProgressDisplay(ctk.CTkFrame):
         """Mark subtask as failed"""
         self.update_subtask(task_id, 0, error or "失败")
     
-    def _create_subtask_ui(self, task: Dict[str, Any]):
-        """Create UI for a subtask"""
-        row = len(self.progress_tasks) - 1
+    def _schedule_row_render(self):
+        """Build subtask rows that have come into view once Tk is idle"""
+        if not self._row_render_scheduled:
+            self._row_render_scheduled = True
+            self.after_idle(self._render_visible_rows)
+    
+    def _render_visible_rows(self):
+        """Build subtask rows down to a few rows past the bottom of the viewport"""
+        self._row_render_scheduled = False
+        tasks = self.progress_tasks
+        rendered = self._rendered_count
+        if rendered >= len(tasks):
+            return
+        
+        canvas = self._subtasks_canvas
+        if canvas is None:
+            target = len(tasks)
+        else:
+            # Rows are built in order, so more are only needed once the view
+            # reaches the end of the rows built so far
+            if rendered and canvas.yview()[1] < 1.0:
+                return
+            
+            visible_rows = canvas.winfo_height() // self.SUBTASK_ROW_HEIGHT + 1
+            target = min(len(tasks), max(rendered, visible_rows) + self.SUBTASK_RENDER_AHEAD)
+        for row in range(rendered, target):
+            task = tasks[row]
+            self._create_subtask_ui(task, row)
+            if task['status'] != 'pending':
+                self._update_subtask_ui(task)
+        self._rendered_count = target
+    
+    def _create_subtask_ui(self, task: Dict[str, Any], row: int):
+        """Create UI for a subtask, reusing a pooled row if there is one"""
+        if self._row_pool:
+            ui = self._row_pool.pop()
+            ui['status_label'].configure(text="○", text_color="gray")
+            ui['title_label'].configure(
+                text=task['title'],
+                text_color=ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+            )
+            ui['progress_bar'].set(0)
+            ui['percent_var'].set("0%")
+            ui['frame'].grid(row=row, column=0, sticky="ew", padx=5, pady=2)
+            task['ui'] = ui
+            task['_ui_state'] = ("○", "gray", None, task['title'])
+            return
         
         # Task frame
         task_frame = ctk.CTkFrame(self.subtasks_frame, fg_color="transparent")
@@ -211,7 +424,7 @@ class ProgressDisplay(ctk.CTkFrame):
         status_label = ctk.CTkLabel(
             task_frame,
             text="○",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color="gray"
         )
         status_label.grid(row=0, column=0, padx=5, pady=2)
@@ -220,7 +433,7 @@ class ProgressDisplay(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             task_frame,
             text=task['title'],
-            font=ctk.CTkFont(size=11)
+            font=get_font(11)
         )
         title_label.grid(row=0, column=1, padx=5, pady=2, sticky="w")
         
@@ -230,10 +443,11 @@ class ProgressDisplay(ctk.CTkFrame):
         progress_bar.set(0)
         
         # Task percentage
+        percent_var = tk.StringVar(task_frame, value="0%")
         percent_label = ctk.CTkLabel(
             task_frame,
-            text="0%",
-            font=ctk.CTkFont(size=10)
+            textvariable=percent_var,
+            font=get_font(10)
         )
         percent_label.grid(row=0, column=3, padx=5, pady=2)
         
@@ -243,81 +457,127 @@ class ProgressDisplay(ctk.CTkFrame):
             'status_label': status_label,
             'title_label': title_label,
             'progress_bar': progress_bar,
-            'percent_label': percent_label
+            'percent_label': percent_label,
+            'percent_var': percent_var
         }
+        # (indicator, indicator color, title color, title text) as displayed
+        task['_ui_state'] = ("○", "gray", None, task['title'])
     
     def _update_subtask_ui(self, task: Dict[str, Any]):
         """Update subtask UI"""
-        if 'ui' not in task:
+        ui = task.get('ui')
+        if ui is None:
             return
         
-        ui = task['ui']
-        
-        # Update progress bar
-        ui['progress_bar'].set(task['progress'] / 100)
-        ui['percent_label'].configure(text=f"{task['progress']}%")
-        
-        # Update status indicator
-        if task['progress'] >= 100:
-            ui['status_label'].configure(text="✓", text_color="green")
-            ui['title_label'].configure(text_color="green")
-        elif task['status'].startswith('失败') or task['status'].startswith('错误'):
-            ui['status_label'].configure(text="✗", text_color="red")
-            ui['title_label'].configure(text_color="red")
-        elif task['status'] == 'running':
-            ui['status_label'].configure(text="●", text_color="blue")
-            ui['title_label'].configure(text_color="blue")
+        self._update_subtask_progress(task, ui)
+        if task.pop('_status_changed', False):
+            self._update_subtask_status(task, ui)
+    
+    def _update_subtask_progress(self, task: Dict[str, Any], ui: Dict[str, Any]):
+        """Redraw a subtask's progress bar and percentage (every update)"""
+        progress = task['progress']
+        
+        # Update progress bar, skipping redraws that would not move a pixel
+        # (subtask bars have a fixed width, read once the row is on screen)
+        bar_width = ui.get('bar_width')
+        if bar_width is None:
+            bar_width = ui['progress_bar'].winfo_width()
+            if bar_width > 1:
+                ui['bar_width'] = bar_width
+        pixel = progress * bar_width // 100
+        if pixel != task.get('_bar_pixel') or progress >= 100 or bar_width <= 1:
+            task['_bar_pixel'] = pixel
+            ui['progress_bar'].set(progress / 100)
+        ui['percent_var'].set(f"{progress}%")
+    
+    def _update_subtask_status(self, task: Dict[str, Any], ui: Dict[str, Any]):
+        """Redraw a subtask's status indicator and title (status changes only)"""
+        progress = task['progress']
+        status = task['status']
+        
+        # Work out the status indicator and title, then configure only what changed
+        if progress >= 100:
+            indicator, color, title_color = "✓", "green", "green"
+        elif status.startswith(('失败', '错误')):
+            indicator, color, title_color = "✗", "red", "red"
+        elif status == 'running':
+            indicator, color, title_color = "●", "blue", "blue"
         else:
-            ui['status_label'].configure(text="○", text_color="gray")
-            ui['title_label'].configure(text_color="black")
+            indicator, color, title_color = "○", "gray", "black"
+        
+        old_indicator, old_color, old_title_color, title_text = task['_ui_state']
+        
+        if (indicator, color) != (old_indicator, old_color):
+            ui['status_label'].configure(text=indicator, text_color=color)
+        
+        title_changes = {}
+        if title_color != old_title_color:
+            title_changes['text_color'] = title_color
         
         # Update title with status
-        if task['status'] and task['status'] != 'running':
-            ui['title_label'].configure(text=f"{task['title']} - {task['status']}")
+        if status and status != 'running':
+            new_title_text = f"{task['title']} - {status}"
+            if new_title_text != title_text:
+                title_changes['text'] = title_text = new_title_text
+        
+        if title_changes:
+            ui['title_label'].configure(**title_changes)
+        
+        task['_ui_state'] = (indicator, color, title_color, title_text)
     
     def _update_overall_progress(self):
         """Update overall progress based on subtasks"""
         if not self.progress_tasks:
             return
         
-        total_weight = sum(task['weight'] for task in self.progress_tasks)
-        weighted_progress = sum(task['progress'] * task['weight'] for task in self.progress_tasks)
-        
-        overall_progress = int(weighted_progress / total_weight) if total_weight > 0 else 0
-        self.update_progress(overall_progress)
+        total_weight = self._total_weight
+        overall_progress = int(self._weighted_progress / total_weight) if total_weight > 0 else 0
+        self._apply_progress(overall_progress)
+    
+    def _set_status_text(self, text: str):
+        """Set the status text, skipping the configure if it is already shown"""
+        if text != self._status_text:
+            self._status_text = text
+            self.status_var.set(text)
+    
+    def _cancel_time_display(self):
+        """Cancel the pending time display refresh, if any"""
+        if self._time_after_id is not None:
+            self.after_cancel(self._time_after_id)
+            self._time_after_id = None
     
     def _update_time_display(self):
         """Update time display"""
+        # Never run more than one refresh chain (show/resume restart it)
+        self._cancel_time_display()
+        
         if not self.current_operation:
             return
         
-        if self.current_operation['start_time']:
-            elapsed = datetime.now() - self.current_operation['start_time']
-            elapsed_str = str(elapsed).split('.')[0]  # Remove microseconds
+        progress = self.current_operation['progress']
+        if progress > 0:
+            # Estimate remaining time
+            elapsed = time.monotonic() - self.current_operation['start_monotonic']
+            remaining_seconds = int(elapsed * 100 / progress - elapsed)
             
-            if self.current_operation['progress'] > 0:
-                # Estimate remaining time
-                total_estimated = elapsed.total_seconds() / (self.current_operation['progress'] / 100)
-                remaining_seconds = total_estimated - elapsed.total_seconds()
-                
-                if remaining_seconds > 0:
-                    remaining_str = f"剩余时间: {int(remaining_seconds // 60)}分{int(remaining_seconds % 60)}秒"
-                    self.status_label.configure(text=f"{self.current_operation['description']} | {remaining_str}")
+            if remaining_seconds > 0:
+                remaining_str = f"剩余时间: {remaining_seconds // 60}分{remaining_seconds % 60}秒"
+                self._set_status_text(f"{self.current_operation['description']} | {remaining_str}")
         
         # Schedule next update
         if self.current_operation and self.current_operation['status'] == 'running':
-            self.after(1000, self._update_time_display)
+            self._time_after_id = self.after(1000, self._update_time_display)
     
     def _cancel_operation(self):
         """Cancel current operation"""
         if not self.current_operation:
             return
         
-        result = tk.messagebox.askyesno("确认", "确定要取消当前操作吗？")
+        result = messagebox.askyesno("确认", "确定要取消当前操作吗？")
         if result:
             self.current_operation['cancelled'] = True
             self.current_operation['status'] = 'cancelled'
-            self.status_label.configure(text="操作已取消")
+            self._set_status_text("操作已取消")
             self.cancel_btn.configure(state="disabled")
             self.pause_btn.configure(state="disabled")
             
@@ -334,7 +594,7 @@ class ProgressDisplay(ctk.CTkFrame):
             # Resume
             self.current_operation['paused'] = False
             self.pause_btn.configure(text="暂停")
-            self.status_label.configure(text="操作已恢复")
+            self._set_status_text("操作已恢复")
             
             # Resume time updates
             self._update_time_display()
@@ -346,7 +606,7 @@ class ProgressDisplay(ctk.CTkFrame):
             # Pause
             self.current_operation['paused'] = True
             self.pause_btn.configure(text="继续")
-            self.status_label.configure(text="操作已暂停")
+            self._set_status_text("操作已暂停")
             
             # Notify parent
             if hasattr(self.parent, 'on_operation_paused'):
@@ -367,22 +627,25 @@ class ProgressDisplay(ctk.CTkFrame):
         details_text = ctk.CTkTextbox(details_window)
         details_text.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Add details
-        details = f"操作: {self.current_operation['title']}\n"
-        details += f"状态: {self.current_operation['status']}\n"
-        details += f"进度: {self.current_operation['progress']}%\n"
+        # Add details (built as a list and inserted with a single call)
+        parts = [
+            f"操作: {self.current_operation['title']}\n",
+            f"状态: {self.current_operation['status']}\n",
+            f"进度: {self.current_operation['progress']}%\n"
+        ]
         
         if self.current_operation['start_time']:
             elapsed = datetime.now() - self.current_operation['start_time']
-            details += f"已用时间: {str(elapsed).split('.')[0]}\n"
+            parts.append(f"已用时间: {str(elapsed).split('.')[0]}\n")
         
-        details += f"\n子任务 ({len(self.progress_tasks)}):\n"
-        details += "-" * 40 + "\n"
-        
-        for task in self.progress_tasks:
-            details += f"• {task['title']}: {task['progress']}% - {task['status']}\n"
+        parts.append(f"\n子任务 ({len(self.progress_tasks)}):\n")
+        parts.append("-" * 40 + "\n")
+        parts.extend(
+            f"• {task['title']}: {task['progress']}% - {task['status']}\n"
+            for task in self.progress_tasks
+        )
         
-        details_text.insert("1.0", details)
+        details_text.insert("1.0", "".join(parts))
         details_text.configure(state="disabled")
         
         # Close button
@@ -400,7 +663,7 @@ class ProgressDisplay(ctk.CTkFrame):
             return
         
         self.current_operation['status'] = 'completed'
-        self.status_label.configure(text="操作完成")
+        self._set_status_text("操作完成")
         self.cancel_btn.configure(state="disabled")
         self.pause_btn.configure(state="disabled")
         
@@ -421,12 +684,16 @@ class ProgressDisplay(ctk.CTkFrame):
         return self.current_operation['progress'] if self.current_operation else 0
     
     def set_error(self, error_message: str):
-        """Set error state"""
+        """Set error state (safe to call from any thread)"""
+        self._msg_q.append((self._apply_error, (error_message,)))
+    
+    def _apply_error(self, error_message: str):
+        """Apply the error state"""
         if not self.current_operation:
             return
         
         self.current_operation['status'] = 'error'
-        self.status_label.configure(text=f"错误: {error_message}")
+        self._set_status_text(f"错误: {error_message}")
         self.cancel_btn.configure(state="disabled")
         self.pause_btn.configure(state="disabled")
         
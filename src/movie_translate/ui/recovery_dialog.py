@@ -3,44 +3,184 @@ Recovery dialog for Movie Translate UI
 Handles recovery of interrupted work
 """
 
+import asyncio
 import customtkinter as ctk
 import tkinter as tk
+from functools import partial
 from tkinter import ttk, messagebox
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from datetime import datetime, timedelta
 
 from movie_translate.core.interrupt_recovery import get_interrupt_recovery
 from movie_translate.core import logger
+from movie_translate.ui.fonts import get_font
+
+
+def _fmt_time(ts: datetime) -> str:
+    """Format a timestamp as HH:MM:SS without going through strftime"""
+    return f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+
+
+def _fmt_ts(ts: datetime) -> str:
+    """Format a timestamp as YYYY-MM-DD HH:MM:SS without going through strftime"""
+    return f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d} {_fmt_time(ts)}"
+
+
+class ConfirmDialog(ctk.CTkToplevel):
+    """Yes/no confirmation that reports the answer through a callback
+    
+    Unlike messagebox.askyesno this does not run a nested event loop, so
+    timers and background callbacks keep running while it is open.
+    """
+    
+    def __init__(self, parent, title: str, message: str, callback: Callable[[bool], None]):
+        super().__init__(parent)
+        self.parent = parent
+        self._callback = callback
+        self.title(title)
+        self.resizable(False, False)
+        self.transient(parent)
+        
+        message_label = ctk.CTkLabel(
+            self,
+            text=message,
+            font=get_font(12),
+            wraplength=360,
+            justify="left"
+        )
+        message_label.pack(padx=20, pady=(20, 10))
+        
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.pack(pady=(0, 20))
+        
+        yes_btn = ctk.CTkButton(
+            button_frame,
+            text="是",
+            width=80,
+            command=partial(self._answer, True)
+        )
+        yes_btn.pack(side="left", padx=10)
+        
+        no_btn = ctk.CTkButton(
+            button_frame,
+            text="否",
+            width=80,
+            command=partial(self._answer, False)
+        )
+        no_btn.pack(side="left", padx=10)
+        
+        # Closing the window counts as "no"
+        self.protocol("WM_DELETE_WINDOW", partial(self._answer, False))
+        self.grab_set()
+    
+    def _answer(self, confirmed: bool):
+        """Close the dialog and report the answer"""
+        callback = self._callback
+        self._callback = None
+        self.destroy()
+        
+        # Hand the grab back to the dialog that opened this one
+        if self.parent.winfo_exists():
+            self.parent.grab_set()
+        
+        if callback is not None:
+            callback(confirmed)
 
 
 class RecoveryDialog(ctk.CTkToplevel):
-    """Recovery dialog for handling interrupted work"""
+    """Recovery dialog for handling interrupted work
+    
+    Closing the dialog hides it instead of destroying it, so
+    show_recovery_dialog can show the same instance again and only
+    reload the data.
+    """
+    
+    WIDTH = 600
+    HEIGHT = 500
+    
+    # Checkpoint rows rendered per page of the list
+    CHECKPOINT_PAGE_SIZE = 50
     
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
+        self._parent_load = getattr(parent, 'load_recovery_data', None)
+        self._recovery = get_interrupt_recovery()
         self.title("恢复工作")
-        self.geometry("600x500")
+        self.geometry(f"{self.WIDTH}x{self.HEIGHT}")
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.close)
         
         self.recovery_data = None
         self.checkpoints = []
+        self._refresh_pending = None
+        self._row_widgets = {}
+        self._rendered_count = 0
+        self._show_more_btn = None
+        self._load_token = 0
+        self._closed_var = tk.BooleanVar(master=self, value=False)
         
         # Create UI
         self._create_ui()
         
+        self.show()
+    
+    def show(self):
+        """Show the dialog with freshly loaded recovery data"""
+        self._reset()
+        self._closed_var.set(False)
+        
         # Load recovery data
         self._load_recovery_data()
         
         # Center the dialog
         self._center_window()
+        self.deiconify()
+        self.grab_set()
+    
+    def close(self):
+        """Hide the dialog so it can be shown again"""
+        if self._refresh_pending:
+            self.after_cancel(self._refresh_pending)
+            self._refresh_pending = None
+        
+        self.grab_release()
+        self.withdraw()
+        self._closed_var.set(True)
+    
+    def wait_closed(self):
+        """Wait until the dialog is closed or destroyed"""
+        self.wait_variable(self._closed_var)
+    
+    def destroy(self):
+        """Destroy the dialog, releasing anyone waiting on it"""
+        self._closed_var.set(True)
+        super().destroy()
+    
+    def _reset(self):
+        """Put the dialog back into its loading state"""
+        self.recovery_data = None
+        self.recover_btn.configure(state="disabled")
+        
+        # Auto recovery tab
+        self.details_frame.pack_forget()
+        for frame in (self.project_info_frame, self.steps_frame):
+            for widget in frame.winfo_children():
+                widget.destroy()
+        self.loading_label.configure(text="正在检查恢复数据...")
+        self.loading_label.pack(pady=20)
+        
+        # Checkpoints tab
+        self.checkpoints = []
+        self._clear_checkpoint_rows()
+        self.checkpoints_loading_label.configure(text="正在加载检查点...")
+        self.checkpoints_loading_label.pack(pady=20)
     
     def _center_window(self):
         """Center the window on screen"""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
+        # The size is fixed, so no layout pass is needed to measure it
+        width = self.WIDTH
+        height = self.HEIGHT
         x = (self.winfo_screenwidth() // 2) - (width // 2)
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry(f'{width}x{height}+{x}+{y}')
@@ -55,7 +195,7 @@ class RecoveryDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             main_frame,
             text="恢复未完成的工作",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -85,7 +225,7 @@ class RecoveryDialog(ctk.CTkToplevel):
         self.loading_label = ctk.CTkLabel(
             self.info_frame,
             text="正在检查恢复数据...",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.loading_label.pack(pady=20)
         
@@ -105,6 +245,9 @@ class RecoveryDialog(ctk.CTkToplevel):
         checkpoints_frame = ctk.CTkFrame(self.notebook)
         self.notebook.add(checkpoints_frame, text="检查点")
         
+        # One variable shared by all checkpoint radio buttons
+        self._checkpoint_var = tk.StringVar(value="")
+        
         # Checkpoints list
         self.checkpoints_list_frame = ctk.CTkScrollableFrame(checkpoints_frame, height=300)
         self.checkpoints_list_frame.pack(fill="both", expand=True, padx=20, pady=20)
@@ -113,7 +256,7 @@ class RecoveryDialog(ctk.CTkToplevel):
         self.checkpoints_loading_label = ctk.CTkLabel(
             self.checkpoints_list_frame,
             text="正在加载检查点...",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.checkpoints_loading_label.pack(pady=20)
     
@@ -165,31 +308,70 @@ class RecoveryDialog(ctk.CTkToplevel):
         self.cancel_btn = ctk.CTkButton(
             button_frame,
             text="取消",
-            command=self.destroy,
+            command=self.close,
             width=120
         )
         self.cancel_btn.pack(side="right", padx=5)
     
     def _load_recovery_data(self):
-        """Load recovery data"""
+        """Load recovery data
+        
+        The recovery files are read on a worker thread through the parent's
+        run_async when it has one, so the dialog paints while they load.
+        """
+        # Results from an earlier showing of the dialog are ignored
+        self._load_token += 1
+        on_loaded = partial(self._on_recovery_data_loaded, self._load_token)
+        
+        run_async = getattr(self.parent, 'run_async', None)
+        if run_async is not None:
+            run_async(asyncio.to_thread(self._read_recovery_data), on_loaded)
+            return
+        
         try:
-            interrupt_recovery = get_interrupt_recovery()
-            
-            # Check for auto recovery
-            if interrupt_recovery.has_recovery_state():
-                recovery_info = interrupt_recovery.get_recovery_info()
-                
-                if recovery_info['has_state']:
-                    self.recovery_data = interrupt_recovery.load_state()
-                    self._show_recovery_details(recovery_info)
-                    self.recover_btn.configure(state="normal")
-            
-            # Load checkpoints
-            self._load_checkpoints()
-            
+            result = self._read_recovery_data()
         except Exception as e:
-            logger.error(f"Failed to load recovery data: {e}")
+            on_loaded(None, e)
+        else:
+            on_loaded(result, None)
+    
+    def _read_recovery_data(self):
+        """Read the auto-save state and checkpoint list (no UI access)"""
+        recovery_info = None
+        recovery_data = None
+        
+        # Check for auto recovery
+        snapshot = self._recovery.get_recovery_snapshot()
+        if snapshot:
+            recovery_info, recovery_data = snapshot
+        
+        checkpoints = self._prepare_checkpoints(self._recovery.list_checkpoints())
+        return recovery_info, recovery_data, checkpoints
+    
+    def _on_recovery_data_loaded(self, token: int, result, error):
+        """Show loaded recovery data (called on the Tk thread)"""
+        # The dialog may have been destroyed or reopened while loading
+        if not self.winfo_exists() or token != self._load_token:
+            return
+        
+        if error:
+            logger.error(f"Failed to load recovery data: {error}")
             self.loading_label.configure(text="无法加载恢复数据")
+            self.checkpoints_loading_label.configure(text="无法加载检查点")
+            return
+        
+        recovery_info, recovery_data, checkpoints = result
+        
+        if recovery_data is not None:
+            # The state was read on a worker thread; adopt it here
+            self._recovery.current_state = recovery_data
+            self.recovery_data = recovery_data
+            self._show_recovery_details(recovery_info)
+            self.recover_btn.configure(state="normal")
+        else:
+            self.loading_label.configure(text="没有发现未完成的工作")
+        
+        self._show_checkpoints(checkpoints)
     
     def _show_recovery_details(self, recovery_info: Dict[str, Any]):
         """Show recovery details"""
@@ -201,19 +383,21 @@ class RecoveryDialog(ctk.CTkToplevel):
         
         # Format timestamp
         timestamp = datetime.fromisoformat(recovery_info['timestamp'])
-        time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        time_str = _fmt_ts(timestamp)
         age_str = self._format_age(recovery_info['age'])
         
         # Create info labels
-        info_text = f"发现未完成的工作\n"
-        info_text += f"保存时间: {time_str}\n"
-        info_text += f"年龄: {age_str}\n"
-        info_text += f"版本: {recovery_info['version']}"
+        info_text = (
+            f"发现未完成的工作\n"
+            f"保存时间: {time_str}\n"
+            f"年龄: {age_str}\n"
+            f"版本: {recovery_info['version']}"
+        )
         
         info_label = ctk.CTkLabel(
             self.project_info_frame,
             text=info_text,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             justify="left"
         )
         info_label.pack(pady=10)
@@ -222,18 +406,19 @@ class RecoveryDialog(ctk.CTkToplevel):
         if self.recovery_data and 'project' in self.recovery_data:
             project_data = self.recovery_data['project']
             
-            project_text = "项目信息:\n"
+            parts = ["项目信息:"]
             if 'name' in project_data:
-                project_text += f"项目名称: {project_data['name']}\n"
+                parts.append(f"项目名称: {project_data['name']}")
             if 'video_file' in project_data:
-                project_text += f"视频文件: {project_data['video_file']}\n"
+                parts.append(f"视频文件: {project_data['video_file']}")
             if 'current_step' in project_data:
-                project_text += f"当前步骤: {project_data['current_step']}"
+                parts.append(f"当前步骤: {project_data['current_step']}")
+            project_text = "\n".join(parts)
             
             project_label = ctk.CTkLabel(
                 self.project_info_frame,
                 text=project_text,
-                font=ctk.CTkFont(size=11),
+                font=get_font(11),
                 justify="left"
             )
             project_label.pack(pady=5)
@@ -245,98 +430,159 @@ class RecoveryDialog(ctk.CTkToplevel):
             steps_label = ctk.CTkLabel(
                 self.steps_frame,
                 text="步骤进度:",
-                font=ctk.CTkFont(size=12, weight="bold")
+                font=get_font(12, "bold")
             )
             steps_label.pack(pady=(10, 5))
             
-            for step_id, step_info in steps_data.items():
-                step_timestamp = datetime.fromisoformat(step_info['timestamp'])
-                step_time_str = step_timestamp.strftime("%H:%M:%S")
-                
-                step_text = f"步骤 {step_id}: {step_time_str}"
-                step_label = ctk.CTkLabel(
-                    self.steps_frame,
-                    text=step_text,
-                    font=ctk.CTkFont(size=11)
-                )
-                step_label.pack(pady=2)
+            # All steps go into one read-only textbox rather than a label each
+            steps_text = "\n".join(
+                f"步骤 {step_id}: {_fmt_time(datetime.fromisoformat(step_info['timestamp']))}"
+                for step_id, step_info in steps_data.items()
+            )
+            
+            steps_textbox = ctk.CTkTextbox(
+                self.steps_frame,
+                height=min(200, 22 * len(steps_data) + 10),
+                font=get_font(11)
+            )
+            steps_textbox.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+            steps_textbox.insert("1.0", steps_text)
+            steps_textbox.configure(state="disabled")
     
     def _load_checkpoints(self):
         """Load checkpoints"""
         try:
-            interrupt_recovery = get_interrupt_recovery()
-            self.checkpoints = interrupt_recovery.list_checkpoints()
-            
-            # Hide loading label
-            self.checkpoints_loading_label.pack_forget()
-            
-            if self.checkpoints:
-                self._display_checkpoints()
-            else:
-                no_checkpoints_label = ctk.CTkLabel(
-                    self.checkpoints_list_frame,
-                    text="没有可用的检查点",
-                    font=ctk.CTkFont(size=12),
-                    text_color="gray"
-                )
-                no_checkpoints_label.pack(pady=20)
+            checkpoints = self._prepare_checkpoints(self._recovery.list_checkpoints())
+            self._show_checkpoints(checkpoints)
                 
         except Exception as e:
             logger.error(f"Failed to load checkpoints: {e}")
             self.checkpoints_loading_label.configure(text="无法加载检查点")
     
+    def _prepare_checkpoints(self, checkpoints):
+        """Format each checkpoint's timestamp once, ahead of rendering"""
+        for checkpoint in checkpoints:
+            checkpoint['_ts_str'] = _fmt_ts(datetime.fromisoformat(checkpoint['timestamp']))
+        return checkpoints
+    
+    def _schedule_refresh(self):
+        """Refresh the checkpoint list shortly, coalescing repeated requests"""
+        if self._refresh_pending:
+            self.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.after(50, self._do_refresh_checkpoints)
+    
+    def _do_refresh_checkpoints(self):
+        """Run a scheduled checkpoint list refresh"""
+        self._refresh_pending = None
+        if self.winfo_exists():
+            self._load_checkpoints()
+    
+    def _show_checkpoints(self, checkpoints):
+        """Show the checkpoint list"""
+        self.checkpoints = checkpoints
+        
+        # Hide loading label
+        self.checkpoints_loading_label.pack_forget()
+        
+        # Drop rows from a previous load
+        self._clear_checkpoint_rows()
+        
+        if self.checkpoints:
+            self._display_checkpoints()
+        else:
+            no_checkpoints_label = ctk.CTkLabel(
+                self.checkpoints_list_frame,
+                text="没有可用的检查点",
+                font=get_font(12),
+                text_color="gray"
+            )
+            no_checkpoints_label.pack(pady=20)
+    
+    def _clear_checkpoint_rows(self):
+        """Remove all checkpoint rows and the selection"""
+        for widget in self.checkpoints_list_frame.winfo_children():
+            if widget is not self.checkpoints_loading_label:
+                widget.destroy()
+        self._row_widgets = {}
+        self._rendered_count = 0
+        self._show_more_btn = None
+        self._clear_selection()
+    
     def _display_checkpoints(self):
-        """Display checkpoints list"""
-        self.selected_checkpoint = None
+        """Display the next page of the checkpoints list
         
-        for i, checkpoint in enumerate(self.checkpoints):
+        Checkpoints arrive newest first; only CHECKPOINT_PAGE_SIZE rows are
+        rendered at a time, with a button to render the next page.
+        """
+        start = self._rendered_count
+        page = self.checkpoints[start:start + self.CHECKPOINT_PAGE_SIZE]
+        self._rendered_count = start + len(page)
+        
+        list_frame = self.checkpoints_list_frame
+        
+        # Keep the show-more button below the rows
+        if self._show_more_btn is not None:
+            self._show_more_btn.pack_forget()
+        
+        for checkpoint in page:
             # Checkpoint frame
-            checkpoint_frame = ctk.CTkFrame(self.checkpoints_list_frame)
+            checkpoint_frame = ctk.CTkFrame(list_frame)
             checkpoint_frame.pack(fill="x", padx=10, pady=5)
+            self._row_widgets[checkpoint['name']] = checkpoint_frame
             
-            # Radio button
-            radio_var = tk.StringVar()
+            # Radio button, labelled with the checkpoint name
             radio_btn = ctk.CTkRadioButton(
                 checkpoint_frame,
-                text="",
-                variable=radio_var,
-                value=checkpoint['name'],
-                command=lambda cp=checkpoint: self._select_checkpoint(cp)
-            )
-            radio_btn.pack(side="left", padx=10)
-            
-            # Checkpoint info
-            info_frame = ctk.CTkFrame(checkpoint_frame, fg_color="transparent")
-            info_frame.pack(side="left", fill="x", expand=True, padx=10)
-            
-            # Name
-            name_label = ctk.CTkLabel(
-                info_frame,
                 text=checkpoint['name'],
-                font=ctk.CTkFont(size=12, weight="bold")
-            )
-            name_label.pack(anchor="w")
-            
-            # Timestamp
-            timestamp = datetime.fromisoformat(checkpoint['timestamp'])
-            time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            
-            time_label = ctk.CTkLabel(
-                info_frame,
-                text=time_str,
-                font=ctk.CTkFont(size=10),
-                text_color="gray"
+                font=get_font(12, "bold"),
+                variable=self._checkpoint_var,
+                value=checkpoint['name'],
+                command=partial(self._select_checkpoint, checkpoint)
             )
-            time_label.pack(anchor="w")
+            radio_btn.pack(side="left", padx=10, pady=5)
             
-            # Version
-            version_label = ctk.CTkLabel(
-                info_frame,
-                text=f"版本: {checkpoint['version']}",
-                font=ctk.CTkFont(size=10),
-                text_color="gray"
+            # Timestamp and version share one label
+            info_label = ctk.CTkLabel(
+                checkpoint_frame,
+                text=f"{checkpoint['_ts_str']}\n版本: {checkpoint['version']}",
+                font=get_font(10),
+                text_color="gray",
+                justify="right"
             )
-            version_label.pack(anchor="w")
+            info_label.pack(side="right", padx=10)
+        
+        remaining = len(self.checkpoints) - self._rendered_count
+        if remaining > 0:
+            if self._show_more_btn is None:
+                self._show_more_btn = ctk.CTkButton(
+                    list_frame,
+                    command=self._display_checkpoints
+                )
+            self._show_more_btn.configure(text=f"显示更多 ({remaining})")
+            self._show_more_btn.pack(pady=10)
+    
+    def _clear_selection(self):
+        """Clear the selected checkpoint"""
+        self.selected_checkpoint = None
+        self._checkpoint_var.set("")
+        self.load_checkpoint_btn.configure(state="disabled")
+        self.delete_checkpoint_btn.configure(state="disabled")
+    
+    def _remove_checkpoint_row(self, name: str):
+        """Remove one checkpoint's row without rebuilding the list"""
+        row = self._row_widgets.pop(name, None)
+        if row is None:
+            # Row is not on screen, fall back to a full refresh
+            self._schedule_refresh()
+            return
+        
+        row.destroy()
+        self.checkpoints = [cp for cp in self.checkpoints if cp['name'] != name]
+        self._rendered_count -= 1
+        self._clear_selection()
+        
+        if not self.checkpoints:
+            self._show_checkpoints(self.checkpoints)
     
     def _select_checkpoint(self, checkpoint: Dict[str, Any]):
         """Select a checkpoint"""
@@ -360,26 +606,29 @@ class RecoveryDialog(ctk.CTkToplevel):
         if not self.recovery_data:
             return
         
+        # Confirm recovery
+        ConfirmDialog(
+            self,
+            "确认恢复",
+            "确定要恢复未完成的工作吗？这将覆盖当前的项目状态。",
+            self._recover_work_confirmed
+        )
+    
+    def _recover_work_confirmed(self, confirmed: bool):
+        """Recover work once the user has confirmed"""
+        if not confirmed:
+            return
+        
         try:
-            # Confirm recovery
-            result = messagebox.askyesno(
-                "确认恢复",
-                "确定要恢复未完成的工作吗？这将覆盖当前的项目状态。"
-            )
-            
-            if not result:
-                return
-            
             # Load recovery data into parent
-            if hasattr(self.parent, 'load_recovery_data'):
-                self.parent.load_recovery_data(self.recovery_data)
+            if self._parent_load is not None:
+                self._parent_load(self.recovery_data)
             
             # Clear recovery state
-            interrupt_recovery = get_interrupt_recovery()
-            interrupt_recovery.clear_recovery_state()
+            self._recovery.clear_recovery_state()
             
             messagebox.showinfo("成功", "工作已恢复")
-            self.destroy()
+            self.close()
             
         except Exception as e:
             logger.error(f"Failed to recover work: {e}")
@@ -390,27 +639,32 @@ class RecoveryDialog(ctk.CTkToplevel):
         if not self.selected_checkpoint:
             return
         
+        name = self.selected_checkpoint['name']
+        
+        # Confirm loading
+        ConfirmDialog(
+            self,
+            "确认加载",
+            f"确定要加载检查点 '{name}' 吗？这将覆盖当前的项目状态。",
+            partial(self._load_checkpoint_confirmed, name)
+        )
+    
+    def _load_checkpoint_confirmed(self, name: str, confirmed: bool):
+        """Load a checkpoint once the user has confirmed"""
+        if not confirmed:
+            return
+        
         try:
-            # Confirm loading
-            result = messagebox.askyesno(
-                "确认加载",
-                f"确定要加载检查点 '{self.selected_checkpoint['name']}' 吗？这将覆盖当前的项目状态。"
-            )
-            
-            if not result:
-                return
-            
             # Load checkpoint
-            interrupt_recovery = get_interrupt_recovery()
-            success = interrupt_recovery.load_checkpoint(self.selected_checkpoint['name'])
+            success = self._recovery.load_checkpoint(name)
             
             if success:
                 # Load recovery data into parent
-                if hasattr(self.parent, 'load_recovery_data'):
-                    self.parent.load_recovery_data(interrupt_recovery.current_state)
+                if self._parent_load is not None:
+                    self._parent_load(self._recovery.current_state)
                 
-                messagebox.showinfo("成功", f"检查点 '{self.selected_checkpoint['name']}' 已加载")
-                self.destroy()
+                messagebox.showinfo("成功", f"检查点 '{name}' 已加载")
+                self.close()
             else:
                 messagebox.showerror("错误", "加载检查点失败")
                 
@@ -423,24 +677,29 @@ class RecoveryDialog(ctk.CTkToplevel):
         if not self.selected_checkpoint:
             return
         
+        name = self.selected_checkpoint['name']
+        
+        # Confirm deletion
+        ConfirmDialog(
+            self,
+            "确认删除",
+            f"确定要删除检查点 '{name}' 吗？此操作不可撤销。",
+            partial(self._delete_checkpoint_confirmed, name)
+        )
+    
+    def _delete_checkpoint_confirmed(self, name: str, confirmed: bool):
+        """Delete a checkpoint once the user has confirmed"""
+        if not confirmed:
+            return
+        
         try:
-            # Confirm deletion
-            result = messagebox.askyesno(
-                "确认删除",
-                f"确定要删除检查点 '{self.selected_checkpoint['name']}' 吗？此操作不可撤销。"
-            )
-            
-            if not result:
-                return
-            
             # Delete checkpoint
-            interrupt_recovery = get_interrupt_recovery()
-            interrupt_recovery.delete_checkpoint(self.selected_checkpoint['name'])
+            self._recovery.delete_checkpoint(name)
             
-            # Refresh checkpoints list
-            self._load_checkpoints()
+            # Drop its row from the list
+            self._remove_checkpoint_row(name)
             
-            messagebox.showinfo("成功", f"检查点 '{self.selected_checkpoint['name']}' 已删除")
+            messagebox.showinfo("成功", f"检查点 '{name}' 已删除")
             
         except Exception as e:
             logger.error(f"Failed to delete checkpoint: {e}")
@@ -448,22 +707,25 @@ class RecoveryDialog(ctk.CTkToplevel):
     
     def _new_project(self):
         """Start new project (clear recovery)"""
+        # Confirm new project
+        ConfirmDialog(
+            self,
+            "确认新建项目",
+            "确定要新建项目吗？所有未完成的恢复数据将被清除。",
+            self._new_project_confirmed
+        )
+    
+    def _new_project_confirmed(self, confirmed: bool):
+        """Clear recovery data once the user has confirmed"""
+        if not confirmed:
+            return
+        
         try:
-            # Confirm new project
-            result = messagebox.askyesno(
-                "确认新建项目",
-                "确定要新建项目吗？所有未完成的恢复数据将被清除。"
-            )
-            
-            if not result:
-                return
-            
             # Clear recovery state
-            interrupt_recovery = get_interrupt_recovery()
-            interrupt_recovery.clear_recovery_state()
+            self._recovery.clear_recovery_state()
             
             # Close dialog
-            self.destroy()
+            self.close()
             
         except Exception as e:
             logger.error(f"Failed to clear recovery: {e}")
@@ -471,7 +733,16 @@ class RecoveryDialog(ctk.CTkToplevel):
 
 
 def show_recovery_dialog(parent):
-    """Show recovery dialog"""
-    dialog = RecoveryDialog(parent)
-    dialog.wait_window()
+    """Show recovery dialog
+    
+    The dialog is created once per parent and reused on later calls.
+    """
+    dialog = getattr(parent, '_recovery_dialog', None)
+    if dialog is None or not dialog.winfo_exists():
+        dialog = RecoveryDialog(parent)
+        parent._recovery_dialog = dialog
+    else:
+        dialog.show()
+    
+    dialog.wait_closed()
     return dialog.recovery_data
\ No newline at end of file
@@ -6,12 +6,44 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Dict, Any, Optional
+from types import MappingProxyType
+from pathlib import Path
 import json
 
 
+# (key, variable type, default) for every setting, in display order
+FIELDS = (
+    ('ui_language', tk.StringVar, 'zh'),
+    ('theme', tk.StringVar, 'System'),
+    ('temp_dir', tk.StringVar, ''),
+    ('output_dir', tk.StringVar, ''),
+    ('auto_save', tk.BooleanVar, True),
+    ('deepseek_api_key', tk.StringVar, ''),
+    ('glm_api_key', tk.StringVar, ''),
+    ('baidu_app_id', tk.StringVar, ''),
+    ('baidu_api_key', tk.StringVar, ''),
+    ('baidu_secret_key', tk.StringVar, ''),
+    ('minimax_api_key', tk.StringVar, ''),
+    ('translation_service', tk.StringVar, 'deepseek'),
+    ('speech_service', tk.StringVar, 'baidu'),
+    ('voice_service', tk.StringVar, 'f5_tts'),
+    ('batch_size', tk.IntVar, 5),
+    ('max_workers', tk.IntVar, 4),
+    ('enable_cache', tk.BooleanVar, True),
+    ('enable_gpu', tk.BooleanVar, False),
+    ('log_level', tk.StringVar, 'INFO'),
+    ('debug_mode', tk.BooleanVar, False)
+)
+
+
 class SettingsPanel(ctk.CTkToplevel):
     """Settings dialog for Movie Translate"""
     
+    # Parsed settings.json, shared by all panels and refreshed on save
+    _settings_cache: Optional[Dict[str, Any]] = None
+    
+    _DEFAULT_SETTINGS = MappingProxyType({name: default for name, _, default in FIELDS})
+    
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
@@ -23,15 +55,23 @@ class SettingsPanel(ctk.CTkToplevel):
         # Settings data
         self.settings_data = self._load_settings()
         
+        # Setting variables exist up front so unbuilt tabs still apply
+        self._create_variables()
+        
         # Create notebook for tabbed interface
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Create tabs
-        self._create_general_tab()
-        self._create_api_tab()
-        self._create_services_tab()
-        self._create_advanced_tab()
+        # Create tabs; each tab's widgets are built when it is first selected
+        self._tab_builders = {}
+        self._add_tab("常规", self._create_general_tab)
+        self._add_tab("API设置", self._create_api_tab)
+        self._add_tab("服务设置", self._create_services_tab)
+        self._add_tab("高级", self._create_advanced_tab)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
+        # Build the first tab now so the dialog opens populated
+        self._build_tab(self.notebook.select())
         
         # Bottom buttons
         self._create_bottom_buttons()
@@ -48,11 +88,32 @@ class SettingsPanel(ctk.CTkToplevel):
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry(f'{width}x{height}+{x}+{y}')
     
-    def _create_general_tab(self):
+    def _create_variables(self):
+        """Create the variables backing every setting"""
+        self._vars = {
+            name: var_type(value=self.settings_data.get(name, default))
+            for name, var_type, default in FIELDS
+        }
+    
+    def _add_tab(self, text: str, builder):
+        """Add an empty tab whose contents are built on first selection"""
+        frame = ctk.CTkFrame(self.notebook)
+        self.notebook.add(frame, text=text)
+        self._tab_builders[str(frame)] = (frame, builder)
+    
+    def _build_tab(self, tab_id: str):
+        """Build a tab's widgets if they have not been built yet"""
+        entry = self._tab_builders.pop(tab_id, None)
+        if entry:
+            frame, builder = entry
+            builder(frame)
+    
+    def _on_tab_changed(self, event=None):
+        """Build the newly selected tab"""
+        self._build_tab(self.notebook.select())
+    
+    def _create_general_tab(self, general_frame):
         """Create general settings tab"""
-        general_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(general_frame, text="常规")
-        
         # Language settings
         lang_frame = ctk.CTkFrame(general_frame)
         lang_frame.pack(fill="x", padx=20, pady=10)
@@ -64,10 +125,9 @@ class SettingsPanel(ctk.CTkToplevel):
         )
         lang_label.pack(anchor="w", padx=10, pady=5)
         
-        self.ui_lang_var = tk.StringVar(value=self.settings_data.get('ui_language', 'zh'))
         lang_combo = ctk.CTkComboBox(
             lang_frame,
-            variable=self.ui_lang_var,
+            variable=self._vars['ui_language'],
             values=["zh", "en"],
             width=200
         )
@@ -84,10 +144,9 @@ class SettingsPanel(ctk.CTkToplevel):
         )
         theme_label.pack(anchor="w", padx=10, pady=5)
         
-        self.theme_var = tk.StringVar(value=self.settings_data.get('theme', 'System'))
         theme_combo = ctk.CTkComboBox(
             theme_frame,
-            variable=self.theme_var,
+            variable=self._vars['theme'],
             values=["System", "Light", "Dark"],
             width=200
         )
@@ -111,8 +170,7 @@ class SettingsPanel(ctk.CTkToplevel):
         temp_label = ctk.CTkLabel(temp_frame, text="临时文件目录:")
         temp_label.pack(side="left", padx=5)
         
-        self.temp_dir_var = tk.StringVar(value=self.settings_data.get('temp_dir', ''))
-        temp_entry = ctk.CTkEntry(temp_frame, variable=self.temp_dir_var, width=300)
+        temp_entry = ctk.CTkEntry(temp_frame, variable=self._vars['temp_dir'], width=300)
         temp_entry.pack(side="left", padx=5, fill="x", expand=True)
         
         temp_browse_btn = ctk.CTkButton(
@@ -130,8 +188,7 @@ class SettingsPanel(ctk.CTkToplevel):
         output_label = ctk.CTkLabel(output_frame, text="输出文件目录:")
         output_label.pack(side="left", padx=5)
         
-        self.output_dir_var = tk.StringVar(value=self.settings_data.get('output_dir', ''))
-        output_entry = ctk.CTkEntry(output_frame, variable=self.output_dir_var, width=300)
+        output_entry = ctk.CTkEntry(output_frame, variable=self._vars['output_dir'], width=300)
         output_entry.pack(side="left", padx=5, fill="x", expand=True)
         
         output_browse_btn = ctk.CTkButton(
@@ -143,19 +200,15 @@ class SettingsPanel(ctk.CTkToplevel):
         output_browse_btn.pack(side="left", padx=5)
         
         # Auto-save
-        self.auto_save_var = tk.BooleanVar(value=self.settings_data.get('auto_save', True))
         auto_save_check = ctk.CTkCheckBox(
             file_frame,
             text="自动保存项目",
-            variable=self.auto_save_var
+            variable=self._vars['auto_save']
         )
         auto_save_check.pack(anchor="w", padx=10, pady=5)
     
-    def _create_api_tab(self):
+    def _create_api_tab(self, api_frame):
         """Create API settings tab"""
-        api_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(api_frame, text="API设置")
-        
         # API Keys section
         keys_frame = ctk.CTkFrame(api_frame)
         keys_frame.pack(fill="x", padx=20, pady=10)
@@ -174,10 +227,9 @@ class SettingsPanel(ctk.CTkToplevel):
         deepseek_label = ctk.CTkLabel(deepseek_frame, text="DeepSeek API Key:")
         deepseek_label.pack(side="left", padx=5)
         
-        self.deepseek_key_var = tk.StringVar(value=self.settings_data.get('deepseek_api_key', ''))
         deepseek_entry = ctk.CTkEntry(
             deepseek_frame,
-            variable=self.deepseek_key_var,
+            variable=self._vars['deepseek_api_key'],
             width=400,
             show="*"
         )
@@ -190,10 +242,9 @@ class SettingsPanel(ctk.CTkToplevel):
         glm_label = ctk.CTkLabel(glm_frame, text="GLM API Key:")
         glm_label.pack(side="left", padx=5)
         
-        self.glm_key_var = tk.StringVar(value=self.settings_data.get('glm_api_key', ''))
         glm_entry = ctk.CTkEntry(
             glm_frame,
-            variable=self.glm_key_var,
+            variable=self._vars['glm_api_key'],
             width=400,
             show="*"
         )
@@ -206,10 +257,9 @@ class SettingsPanel(ctk.CTkToplevel):
         baidu_label = ctk.CTkLabel(baidu_frame, text="百度 App ID:")
         baidu_label.pack(side="left", padx=5)
         
-        self.baidu_app_id_var = tk.StringVar(value=self.settings_data.get('baidu_app_id', ''))
         baidu_entry = ctk.CTkEntry(
             baidu_frame,
-            variable=self.baidu_app_id_var,
+            variable=self._vars['baidu_app_id'],
             width=200
         )
         baidu_entry.pack(side="left", padx=5, fill="x", expand=True)
@@ -220,10 +270,9 @@ class SettingsPanel(ctk.CTkToplevel):
         baidu_api_label = ctk.CTkLabel(baidu_api_frame, text="百度 API Key:")
         baidu_api_label.pack(side="left", padx=5)
         
-        self.baidu_api_key_var = tk.StringVar(value=self.settings_data.get('baidu_api_key', ''))
         baidu_api_entry = ctk.CTkEntry(
             baidu_api_frame,
-            variable=self.baidu_api_key_var,
+            variable=self._vars['baidu_api_key'],
             width=200,
             show="*"
         )
@@ -235,10 +284,9 @@ class SettingsPanel(ctk.CTkToplevel):
         baidu_secret_label = ctk.CTkLabel(baidu_secret_frame, text="百度 Secret Key:")
         baidu_secret_label.pack(side="left", padx=5)
         
-        self.baidu_secret_key_var = tk.StringVar(value=self.settings_data.get('baidu_secret_key', ''))
         baidu_secret_entry = ctk.CTkEntry(
             baidu_secret_frame,
-            variable=self.baidu_secret_key_var,
+            variable=self._vars['baidu_secret_key'],
             width=200,
             show="*"
         )
@@ -251,20 +299,16 @@ class SettingsPanel(ctk.CTkToplevel):
         minimax_label = ctk.CTkLabel(minimax_frame, text="MiniMax API Key:")
         minimax_label.pack(side="left", padx=5)
         
-        self.minimax_key_var = tk.StringVar(value=self.settings_data.get('minimax_api_key', ''))
         minimax_entry = ctk.CTkEntry(
             minimax_frame,
-            variable=self.minimax_key_var,
+            variable=self._vars['minimax_api_key'],
             width=400,
             show="*"
         )
         minimax_entry.pack(side="left", padx=5, fill="x", expand=True)
     
-    def _create_services_tab(self):
+    def _create_services_tab(self, services_frame):
         """Create services settings tab"""
-        services_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(services_frame, text="服务设置")
-        
         # Translation service
         trans_frame = ctk.CTkFrame(services_frame)
         trans_frame.pack(fill="x", padx=20, pady=10)
@@ -276,10 +320,9 @@ class SettingsPanel(ctk.CTkToplevel):
         )
         trans_label.pack(anchor="w", padx=10, pady=5)
         
-        self.trans_service_var = tk.StringVar(value=self.settings_data.get('translation_service', 'deepseek'))
         trans_combo = ctk.CTkComboBox(
             trans_frame,
-            variable=self.trans_service_var,
+            variable=self._vars['translation_service'],
             values=["deepseek", "glm"],
             width=200
         )
@@ -296,10 +339,9 @@ class SettingsPanel(ctk.CTkToplevel):
         )
         speech_label.pack(anchor="w", padx=10, pady=5)
         
-        self.speech_service_var = tk.StringVar(value=self.settings_data.get('speech_service', 'baidu'))
         speech_combo = ctk.CTkComboBox(
             speech_frame,
-            variable=self.speech_service_var,
+            variable=self._vars['speech_service'],
             values=["baidu", "sensevoice"],
             width=200
         )
@@ -316,10 +358,9 @@ class SettingsPanel(ctk.CTkToplevel):
         )
         voice_label.pack(anchor="w", padx=10, pady=5)
         
-        self.voice_service_var = tk.StringVar(value=self.settings_data.get('voice_service', 'f5_tts'))
         voice_combo = ctk.CTkComboBox(
             voice_frame,
-            variable=self.voice_service_var,
+            variable=self._vars['voice_service'],
             values=["f5_tts", "minimax"],
             width=200
         )
@@ -343,10 +384,9 @@ class SettingsPanel(ctk.CTkToplevel):
         batch_label = ctk.CTkLabel(batch_frame, text="批处理大小:")
         batch_label.pack(side="left", padx=5)
         
-        self.batch_size_var = tk.IntVar(value=self.settings_data.get('batch_size', 5))
         batch_spin = ctk.CTkSpinBox(
             batch_frame,
-            variable=self.batch_size_var,
+            variable=self._vars['batch_size'],
             width=100,
             from_value=1,
             to=20
@@ -360,21 +400,17 @@ class SettingsPanel(ctk.CTkToplevel):
         workers_label = ctk.CTkLabel(workers_frame, text="最大并发数:")
         workers_label.pack(side="left", padx=5)
         
-        self.max_workers_var = tk.IntVar(value=self.settings_data.get('max_workers', 4))
         workers_spin = ctk.CTkSpinBox(
             workers_frame,
-            variable=self.max_workers_var,
+            variable=self._vars['max_workers'],
             width=100,
             from_value=1,
             to=16
         )
         workers_spin.pack(side="left", padx=5)
     
-    def _create_advanced_tab(self):
+    def _create_advanced_tab(self, advanced_frame):
         """Create advanced settings tab"""
-        advanced_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(advanced_frame, text="高级")
-        
         # Performance settings
         perf_frame = ctk.CTkFrame(advanced_frame)
         perf_frame.pack(fill="x", padx=20, pady=10)
@@ -387,20 +423,18 @@ class SettingsPanel(ctk.CTkToplevel):
         perf_label.pack(anchor="w", padx=10, pady=5)
         
         # Cache settings
-        self.cache_var = tk.BooleanVar(value=self.settings_data.get('enable_cache', True))
         cache_check = ctk.CTkCheckBox(
             perf_frame,
             text="启用缓存",
-            variable=self.cache_var
+            variable=self._vars['enable_cache']
         )
         cache_check.pack(anchor="w", padx=10, pady=5)
         
         # GPU acceleration
-        self.gpu_var = tk.BooleanVar(value=self.settings_data.get('enable_gpu', False))
         gpu_check = ctk.CTkCheckBox(
             perf_frame,
             text="启用GPU加速",
-            variable=self.gpu_var
+            variable=self._vars['enable_gpu']
         )
         gpu_check.pack(anchor="w", padx=10, pady=5)
         
@@ -422,21 +456,19 @@ class SettingsPanel(ctk.CTkToplevel):
         level_label = ctk.CTkLabel(level_frame, text="日志级别:")
         level_label.pack(side="left", padx=5)
         
-        self.log_level_var = tk.StringVar(value=self.settings_data.get('log_level', 'INFO'))
         level_combo = ctk.CTkComboBox(
             level_frame,
-            variable=self.log_level_var,
+            variable=self._vars['log_level'],
             values=["DEBUG", "INFO", "WARNING", "ERROR"],
             width=150
         )
         level_combo.pack(side="left", padx=5)
         
         # Debug mode
-        self.debug_var = tk.BooleanVar(value=self.settings_data.get('debug_mode', False))
         debug_check = ctk.CTkCheckBox(
             log_frame,
             text="调试模式",
-            variable=self.debug_var
+            variable=self._vars['debug_mode']
         )
         debug_check.pack(anchor="w", padx=10, pady=5)
         
@@ -486,14 +518,14 @@ class SettingsPanel(ctk.CTkToplevel):
         from tkinter import filedialog
         directory = filedialog.askdirectory(title="选择临时文件目录")
         if directory:
-            self.temp_dir_var.set(directory)
+            self._vars['temp_dir'].set(directory)
     
     def _browse_output_dir(self):
         """Browse for output directory"""
         from tkinter import filedialog
         directory = filedialog.askdirectory(title="选择输出文件目录")
         if directory:
-            self.output_dir_var.set(directory)
+            self._vars['output_dir'].set(directory)
     
     def _test_connection(self):
         """Test API connections"""
@@ -503,34 +535,13 @@ class SettingsPanel(ctk.CTkToplevel):
     def _apply_settings(self):
         """Apply settings and save"""
         # Collect settings
-        new_settings = {
-            'ui_language': self.ui_lang_var.get(),
-            'theme': self.theme_var.get(),
-            'temp_dir': self.temp_dir_var.get(),
-            'output_dir': self.output_dir_var.get(),
-            'auto_save': self.auto_save_var.get(),
-            'deepseek_api_key': self.deepseek_key_var.get(),
-            'glm_api_key': self.glm_key_var.get(),
-            'baidu_app_id': self.baidu_app_id_var.get(),
-            'baidu_api_key': self.baidu_api_key_var.get(),
-            'baidu_secret_key': self.baidu_secret_key_var.get(),
-            'minimax_api_key': self.minimax_key_var.get(),
-            'translation_service': self.trans_service_var.get(),
-            'speech_service': self.speech_service_var.get(),
-            'voice_service': self.voice_service_var.get(),
-            'batch_size': self.batch_size_var.get(),
-            'max_workers': self.max_workers_var.get(),
-            'enable_cache': self.cache_var.get(),
-            'enable_gpu': self.gpu_var.get(),
-            'log_level': self.log_level_var.get(),
-            'debug_mode': self.debug_var.get()
-        }
+        new_settings = {name: var.get() for name, var in self._vars.items()}
         
         # Save settings
         self._save_settings(new_settings)
         
         # Apply theme
-        ctk.set_appearance_mode(self.theme_var.get())
+        ctk.set_appearance_mode(self._vars['theme'].get())
         
         messagebox.showinfo("成功", "设置已保存")
         self.destroy()
@@ -544,14 +555,20 @@ class SettingsPanel(ctk.CTkToplevel):
             messagebox.showinfo("成功", "设置已重置")
     
     def _load_settings(self) -> Dict[str, Any]:
-        """Load settings from file or return defaults"""
-        try:
-            settings_file = Path("settings.json")
-            if settings_file.exists():
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception:
-            pass
+        """Load settings from file or return defaults
+        
+        The file is parsed once and cached on the class; callers get a copy.
+        """
+        if SettingsPanel._settings_cache is None:
+            try:
+                settings_file = Path("settings.json")
+                if settings_file.exists():
+                    SettingsPanel._settings_cache = json.loads(settings_file.read_bytes())
+            except Exception:
+                pass
+        
+        if SettingsPanel._settings_cache is not None:
+            return dict(SettingsPanel._settings_cache)
         
         return self._get_default_settings()
     
@@ -560,53 +577,15 @@ class SettingsPanel(ctk.CTkToplevel):
         try:
             with open("settings.json", 'w', encoding='utf-8') as f:
                 json.dump(settings, f, indent=2, ensure_ascii=False)
+            SettingsPanel._settings_cache = dict(settings)
         except Exception as e:
             messagebox.showerror("错误", f"保存设置失败: {e}")
     
     def _get_default_settings(self) -> Dict[str, Any]:
         """Get default settings"""
-        return {
-            'ui_language': 'zh',
-            'theme': 'System',
-            'temp_dir': '',
-            'output_dir': '',
-            'auto_save': True,
-            'deepseek_api_key': '',
-            'glm_api_key': '',
-            'baidu_app_id': '',
-            'baidu_api_key': '',
-            'baidu_secret_key': '',
-            'minimax_api_key': '',
-            'translation_service': 'deepseek',
-            'speech_service': 'baidu',
-            'voice_service': 'f5_tts',
-            'batch_size': 5,
-            'max_workers': 4,
-            'enable_cache': True,
-            'enable_gpu': False,
-            'log_level': 'INFO',
-            'debug_mode': False
-        }
+        return dict(self._DEFAULT_SETTINGS)
     
     def _load_settings_to_ui(self):
         """Load settings data to UI components"""
-        self.ui_lang_var.set(self.settings_data.get('ui_language', 'zh'))
-        self.theme_var.set(self.settings_data.get('theme', 'System'))
-        self.temp_dir_var.set(self.settings_data.get('temp_dir', ''))
-        self.output_dir_var.set(self.settings_data.get('output_dir', ''))
-        self.auto_save_var.set(self.settings_data.get('auto_save', True))
-        self.deepseek_key_var.set(self.settings_data.get('deepseek_api_key', ''))
-        self.glm_key_var.set(self.settings_data.get('glm_api_key', ''))
-        self.baidu_app_id_var.set(self.settings_data.get('baidu_app_id', ''))
-        self.baidu_api_key_var.set(self.settings_data.get('baidu_api_key', ''))
-        self.baidu_secret_key_var.set(self.settings_data.get('baidu_secret_key', ''))
-        self.minimax_key_var.set(self.settings_data.get('minimax_api_key', ''))
-        self.trans_service_var.set(self.settings_data.get('translation_service', 'deepseek'))
-        self.speech_service_var.set(self.settings_data.get('speech_service', 'baidu'))
-        self.voice_service_var.set(self.settings_data.get('voice_service', 'f5_tts'))
-        self.batch_size_var.set(self.settings_data.get('batch_size', 5))
-        self.max_workers_var.set(self.settings_data.get('max_workers', 4))
-        self.cache_var.set(self.settings_data.get('enable_cache', True))
-        self.gpu_var.set(self.settings_data.get('enable_gpu', False))
-        self.log_level_var.set(self.settings_data.get('log_level', 'INFO'))
-        self.debug_var.set(self.settings_data.get('debug_mode', False))
\ No newline at end of file
+        for name, _, default in FIELDS:
+            self._vars[name].set(self.settings_data.get(name, default))
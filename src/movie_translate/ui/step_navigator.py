@@ -5,6 +5,8 @@ Step navigator component for Movie Translate UI
 import customtkinter as ctk
 from typing import List, Dict, Any, Callable, Optional
 
+from movie_translate.ui.fonts import get_font
+
 
 class StepNavigator(ctk.CTkFrame):
     """Step navigation component"""
@@ -66,7 +68,7 @@ class StepNavigator(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="处理步骤",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         title_label.grid(row=0, column=0, padx=10, pady=(10, 20))
         
@@ -87,7 +89,7 @@ class StepNavigator(ctk.CTkFrame):
             text=step['icon'],
             width=40,
             height=40,
-            font=ctk.CTkFont(size=16),
+            font=get_font(16),
             command=lambda idx=index: self._on_step_click(idx)
         )
         btn.grid(row=0, column=0, padx=5, pady=5)
@@ -101,7 +103,7 @@ class StepNavigator(ctk.CTkFrame):
         name_label = ctk.CTkLabel(
             info_frame,
             text=step['name'],
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=get_font(12, "bold")
         )
         name_label.grid(row=0, column=0, sticky="w")
         
@@ -109,7 +111,7 @@ class StepNavigator(ctk.CTkFrame):
         desc_label = ctk.CTkLabel(
             info_frame,
             text=step['description'],
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="gray"
         )
         desc_label.grid(row=1, column=0, sticky="w")
@@ -118,7 +120,7 @@ class StepNavigator(ctk.CTkFrame):
         status_label = ctk.CTkLabel(
             step_frame,
             text="○",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color="gray"
         )
         status_label.grid(row=0, column=2, padx=5, pady=5)
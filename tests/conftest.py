@@ -5,13 +5,11 @@ Test configuration and fixtures
 import pytest
 import tempfile
 import shutil
+import time
 from pathlib import Path
 from unittest.mock import Mock
 
 from movie_translate.core.config import Settings
-from movie_translate.core.logger import setup_logger
-from movie_translate.models.database_models import Base, get_db_manager
-from movie_translate.models.repositories import get_repositories
 
 
 @pytest.fixture(scope="session")
@@ -41,50 +39,49 @@ def test_settings(test_dir):
     return settings
 
 
-@pytest.fixture(scope="session")
-def test_logger(test_settings):
-    """Setup test logger"""
-    return setup_logger(
-        name="test_logger",
-        log_file=test_settings.log_file,
-        level="DEBUG"
-    )
-
-
-@pytest.fixture(scope="function")
-def test_db(test_settings):
-    """Create test database"""
-    # Initialize database
-    db_manager = get_db_manager()
-    db_manager.engine = None
-    db_manager.SessionLocal = None
-    
-    # Create test database
-    from sqlalchemy import create_engine
-    engine = create_engine(test_settings.database.url, echo=False)
-    Base.metadata.create_all(bind=engine)
+@pytest.fixture
+def recovery(tmp_path, monkeypatch):
+    """Interrupt recovery writing into a temporary directory"""
+    from movie_translate.core.interrupt_recovery import InterruptRecovery
     
-    yield engine
+    # Keep the test process's own signal handlers in place
+    monkeypatch.setattr(InterruptRecovery, "_register_signal_handlers", lambda self: None)
     
-    # Cleanup
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+    instance = InterruptRecovery()
+    instance.recovery_file = tmp_path / "recovery.pkl"
+    instance.backup_file = tmp_path / "recovery_backup.pkl"
+    instance.lock_file = tmp_path / "recovery.lock"
+    return instance
 
 
-@pytest.fixture(scope="function")
-def test_session(test_db):
-    """Create test database session"""
-    from sqlalchemy.orm import sessionmaker
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_db)
-    session = SessionLocal()
-    yield session
-    session.close()
+@pytest.fixture
+def tk_root():
+    """Withdrawn CustomTkinter root window (skipped without a display)"""
+    ctk = pytest.importorskip("customtkinter")
+    import tkinter as tk
+    
+    try:
+        root = ctk.CTk()
+    except tk.TclError as e:
+        pytest.skip(f"No display available: {e}")
+    root.withdraw()
+    yield root
+    root.destroy()
 
 
 @pytest.fixture
-def test_repositories():
-    """Get test repositories"""
-    return get_repositories()
+def pump_events(tk_root):
+    """Run the Tk event loop until a condition holds or the timeout passes"""
+    def pump(condition=lambda: False, timeout: float = 1.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            tk_root.update()
+            if condition():
+                return True
+            time.sleep(0.01)
+        return condition()
+    
+    return pump
 
 
 @pytest.fixture
@@ -0,0 +1,140 @@
+"""
+Unit tests for interrupt recovery module
+"""
+
+import pytest
+
+from movie_translate.core import interrupt_recovery as recovery_module
+from movie_translate.core.error_handler import ErrorSeverity
+
+
+@pytest.fixture
+def handled_errors(monkeypatch):
+    """Record calls to the shared error handler"""
+    calls = []
+
+    def handle_error(error, context=None, severity=ErrorSeverity.MEDIUM, **kwargs):
+        calls.append((error, context, severity))
+
+    monkeypatch.setattr(recovery_module.error_handler, "handle_error", handle_error)
+    return calls
+
+
+class TestWriteSnapshot:
+    """Test writing state snapshots"""
+
+    def test_write_snapshot_writes_file(self, recovery, handled_errors):
+        """Test that a snapshot is written without touching the live state"""
+        recovery.current_state = {"project": {"name": "live"}}
+
+        recovery.write_snapshot({"project": {"name": "snapshot"}})
+
+        assert recovery.recovery_file.exists()
+        assert recovery.current_state == {"project": {"name": "live"}}
+        assert handled_errors == []
+
+        info, state = recovery.get_recovery_snapshot()
+        assert info["has_state"] is True
+        assert state == {"project": {"name": "snapshot"}}
+
+    def test_write_snapshot_keeps_backup(self, recovery, handled_errors):
+        """Test that the previous snapshot is kept as a backup"""
+        recovery.write_snapshot({"step": 1})
+        recovery.write_snapshot({"step": 2})
+
+        assert recovery.backup_file.exists()
+
+    def test_write_snapshot_failure_is_reported(self, recovery, handled_errors, tmp_path):
+        """Test that a failed write reaches the error handler"""
+        recovery.recovery_file = tmp_path / "missing" / "recovery.pkl"
+
+        # Must not raise, even though the directory does not exist
+        recovery.write_snapshot({"step": 1})
+
+        assert len(handled_errors) == 1
+        error, context, severity = handled_errors[0]
+        assert isinstance(error, FileNotFoundError)
+        assert context == {"operation": "write_recovery_snapshot"}
+        assert severity is ErrorSeverity.HIGH
+
+    def test_save_state_failure_is_reported(self, recovery, handled_errors, tmp_path):
+        """Test that a failed save reaches the error handler"""
+        recovery.recovery_file = tmp_path / "missing" / "recovery.pkl"
+
+        recovery.save_state({"step": 1})
+
+        assert len(handled_errors) == 1
+        assert handled_errors[0][2] is ErrorSeverity.HIGH
+
+
+class TestSnapshotState:
+    """Test copying state for background writes"""
+
+    def test_snapshot_state_copies_steps(self, recovery):
+        """Test that the snapshot does not share the steps dict"""
+        recovery.current_state = {"steps": {1: {"data": {}}}}
+
+        snapshot = recovery.snapshot_state()
+        recovery.current_state["steps"][2] = {"data": {}}
+
+        assert list(snapshot["steps"]) == [1]
+
+    def test_snapshot_state_copies_step_data(self, recovery):
+        """Test that later edits to nested step data do not reach the snapshot"""
+        recovery.current_state = {"steps": {1: {"data": {"segments": [1, 2]}}}}
+
+        snapshot = recovery.snapshot_state()
+        recovery.current_state["steps"][1]["data"]["segments"].append(3)
+        recovery.current_state["steps"][1]["data"]["done"] = True
+
+        assert snapshot["steps"][1]["data"] == {"segments": [1, 2]}
+
+    def test_snapshot_state_without_state(self, recovery):
+        """Test snapshot when nothing has been recorded"""
+        recovery.current_state = None
+
+        assert recovery.snapshot_state() == {}
+
+
+class TestRecoverySnapshot:
+    """Test reading recovery info and state together"""
+
+    def test_no_recovery_file(self, recovery):
+        """Test that a missing file gives no snapshot"""
+        assert recovery.get_recovery_snapshot() is None
+
+    def test_snapshot_matches_separate_calls(self, recovery, handled_errors):
+        """Test that the combined read matches get_recovery_info + load_state"""
+        recovery.write_snapshot({"project": {"name": "demo"}})
+
+        info, state = recovery.get_recovery_snapshot()
+        recovery._release_lock()
+
+        separate_info = recovery.get_recovery_info()
+        separate_state = recovery.load_state()
+
+        assert state == separate_state
+        assert info["timestamp"] == separate_info["timestamp"]
+        assert info["version"] == separate_info["version"]
+
+    def test_snapshot_leaves_current_state(self, recovery, handled_errors):
+        """Test that reading a snapshot does not replace the live state"""
+        recovery.write_snapshot({"project": {"name": "saved"}})
+        recovery.current_state = {"project": {"name": "live"}}
+
+        info, state = recovery.get_recovery_snapshot()
+
+        assert state == {"project": {"name": "saved"}}
+        assert recovery.current_state == {"project": {"name": "live"}}
+
+    def test_snapshot_falls_back_to_backup(self, recovery, handled_errors):
+        """Test that a corrupt recovery file falls back to the backup"""
+        recovery.write_snapshot({"step": 1})
+        recovery.write_snapshot({"step": 2})
+        recovery.recovery_file.write_bytes(b"not a pickle")
+
+        info, state = recovery.get_recovery_snapshot()
+
+        assert info["has_state"] is True
+        assert state == {"step": 1}
+        assert len(handled_errors) == 1
@@ -4,295 +4,141 @@ Unit tests for logger module
 
 import pytest
 import logging
-import tempfile
-import os
-from pathlib import Path
-from unittest.mock import patch, Mock
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
 
-from movie_translate.core.logger import setup_logger, get_logger, ColoredFormatter
+from movie_translate.core.config import settings
+from movie_translate.core.logger import ColoredFormatter, MovieTranslateLogger
 
 
-class TestColoredFormatter:
-    """Test ColoredFormatter class"""
-    
-    def test_format_with_color_codes(self):
-        """Test formatting with color codes"""
-        formatter = ColoredFormatter()
-        
-        # Create a mock log record
-        record = Mock()
-        record.levelname = "ERROR"
-        record.getMessage.return_value = "Test message"
-        
-        # Format the record
-        formatted = formatter.format(record)
-        
-        # Check that color codes are included
-        assert "\033[" in formatted
-        assert "Test message" in formatted
-    
-    def test_format_without_color_codes(self):
-        """Test formatting without color codes"""
-        formatter = ColoredFormatter(use_colors=False)
-        
-        # Create a mock log record
-        record = Mock()
-        record.levelname = "ERROR"
-        record.getMessage.return_value = "Test message"
-        
-        # Format the record
-        formatted = formatter.format(record)
-        
-        # Check that no color codes are included
-        assert "\033[" not in formatted
-        assert "Test message" in formatted
+def read_log(path):
+    """Read a log file written by the test logger"""
+    return path.read_text(encoding="utf-8")
 
 
-class TestLoggerSetup:
-    """Test logger setup functionality"""
+@pytest.fixture
+def app_logger(tmp_path, monkeypatch):
+    """MovieTranslateLogger writing into a temporary directory"""
+    monkeypatch.setattr(settings, "log_file", tmp_path / "app.log")
+    monkeypatch.setattr(settings, "log_level", "INFO")
     
-    def test_setup_logger_with_file(self, test_settings):
-        """Test setting up logger with file output"""
-        logger = setup_logger(
-            name="test_logger",
-            log_file=test_settings.log_file,
-            level="DEBUG"
-        )
-        
-        assert isinstance(logger, logging.Logger)
-        assert logger.name == "test_logger"
-        assert logger.level == logging.DEBUG
-        
-        # Check handlers
-        assert len(logger.handlers) == 2  # Console and file handlers
-        
-        # Check that log file exists
-        assert test_settings.log_file.exists()
+    # The app logger reconfigures the shared "movie_translate" logger, so put
+    # the global instance's handlers back afterwards
+    named_logger = logging.getLogger("movie_translate")
+    saved_handlers = list(named_logger.handlers)
+    saved_level = named_logger.level
     
-    def test_setup_logger_without_file(self):
-        """Test setting up logger without file output"""
-        logger = setup_logger(
-            name="test_logger",
-            level="INFO"
-        )
-        
-        assert isinstance(logger, logging.Logger)
-        assert logger.name == "test_logger"
-        assert logger.level == logging.INFO
-        
-        # Check handlers (only console)
-        assert len(logger.handlers) == 1
+    instance = MovieTranslateLogger()
+    yield instance
     
-    def test_setup_logger_different_levels(self, test_settings):
-        """Test setting up logger with different levels"""
-        levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        
-        for level in levels:
-            logger = setup_logger(
-                name=f"test_logger_{level}",
-                log_file=test_settings.log_file,
-                level=level
-            )
-            
-            expected_level = getattr(logging, level)
-            assert logger.level == expected_level
-    
-    def test_setup_logger_with_custom_format(self, test_settings):
-        """Test setting up logger with custom format"""
-        custom_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        logger = setup_logger(
-            name="test_logger",
-            log_file=test_settings.log_file,
-            level="INFO",
-            format_string=custom_format
-        )
-        
-        # Check that format was applied to handlers
-        for handler in logger.handlers:
-            if isinstance(handler.formatter, ColoredFormatter):
-                # For console handler, check base format
-                assert custom_format in handler.formatter._fmt
-            else:
-                # For file handler
-                assert handler.formatter._fmt == custom_format
+    for handler in named_logger.handlers:
+        handler.close()
+    named_logger.handlers[:] = saved_handlers
+    named_logger.setLevel(saved_level)
+
+
+def flush(instance):
+    """Flush all handlers of the logger"""
+    for handler in instance.logger.handlers:
+        handler.flush()
+
+
+class TestColoredFormatter:
+    """Test ColoredFormatter class"""
     
-    def test_logger_output_to_file(self, test_settings):
-        """Test that logger writes to file"""
-        logger = setup_logger(
-            name="test_logger",
-            log_file=test_settings.log_file,
-            level="INFO"
-        )
-        
-        # Log a message
-        test_message = "Test log message"
-        logger.info(test_message)
+    def test_format_with_color_codes(self):
+        """Test that known levels are wrapped in color codes"""
+        formatter = ColoredFormatter("%(levelname)s - %(message)s")
+        record = logging.makeLogRecord({"levelname": "ERROR", "msg": "Test message"})
         
-        # Force flush handlers
-        for handler in logger.handlers:
-            handler.flush()
+        formatted = formatter.format(record)
         
-        # Check that message was written to file
-        if test_settings.log_file.exists():
-            content = test_settings.log_file.read_text()
-            assert test_message in content
+        assert formatted == "\033[31mERROR\033[0m - Test message"
     
-    def test_logger_different_log_levels(self, test_settings):
-        """Test logger with different log levels"""
-        logger = setup_logger(
-            name="test_logger",
-            log_file=test_settings.log_file,
-            level="WARNING"
-        )
-        
-        # Log messages at different levels
-        logger.debug("Debug message")  # Should not appear
-        logger.info("Info message")    # Should not appear
-        logger.warning("Warning message")  # Should appear
-        logger.error("Error message")  # Should appear
+    def test_format_unknown_level(self):
+        """Test that unknown levels are left as they are"""
+        formatter = ColoredFormatter("%(levelname)s - %(message)s")
+        record = logging.makeLogRecord({"levelname": "TRACE", "msg": "Test message"})
         
-        # Force flush handlers
-        for handler in logger.handlers:
-            handler.flush()
+        formatted = formatter.format(record)
         
-        # Check file content
-        if test_settings.log_file.exists():
-            content = test_settings.log_file.read_text()
-            assert "Debug message" not in content
-            assert "Info message" not in content
-            assert "Warning message" in content
-            assert "Error message" in content
+        assert formatted == "TRACE - Test message"
 
 
-class TestGetLogger:
-    """Test get_logger functionality"""
+class TestMovieTranslateLogger:
+    """Test MovieTranslateLogger class"""
     
-    def test_get_logger_existing(self):
-        """Test getting existing logger"""
-        # Create a logger first
-        original_logger = setup_logger(name="test_existing_logger")
-        
-        # Get the same logger
-        retrieved_logger = get_logger("test_existing_logger")
-        
-        assert retrieved_logger is original_logger
+    def test_handlers(self, app_logger):
+        """Test that console, file and error handlers are installed"""
+        handlers = app_logger.logger.handlers
+        file_handlers = [h for h in handlers if isinstance(h, RotatingFileHandler)]
+        
+        assert any(isinstance(h.formatter, ColoredFormatter) for h in handlers)
+        assert [h.level for h in file_handlers] == [logging.DEBUG, logging.ERROR]
+        assert app_logger.logger.propagate is False
     
-    def test_get_logger_nonexistent(self):
-        """Test getting non-existent logger"""
-        logger = get_logger("nonexistent_logger")
-        
-        assert isinstance(logger, logging.Logger)
-        assert logger.name == "nonexistent_logger"
+    def test_info_written_to_file(self, app_logger, tmp_path):
+        """Test that messages reach the log file"""
+        app_logger.info("Test info message")
+        app_logger.debug("Test debug message")
+        flush(app_logger)
+        
+        content = read_log(tmp_path / "app.log")
+        assert "Test info message" in content
+        assert "Test debug message" not in content
     
-    def test_get_logger_default_level(self):
-        """Test getting logger with default level"""
-        logger = get_logger("test_default_logger")
-        
-        # Should use default level from module
-        assert logger.level == logging.INFO
+    def test_set_level(self, app_logger, tmp_path):
+        """Test changing the level at runtime"""
+        app_logger.set_level("debug")
+        app_logger.debug("Test debug message")
+        flush(app_logger)
+        
+        assert app_logger.logger.level == logging.DEBUG
+        assert settings.log_level == "DEBUG"
+        assert "Test debug message" in read_log(tmp_path / "app.log")
     
-    @patch('movie_translate.core.logger.setup_logger')
-    def test_get_logger_calls_setup(self, mock_setup):
-        """Test that get_logger calls setup_logger for new loggers"""
-        mock_setup.return_value = Mock()
-        
-        get_logger("new_test_logger")
+    def test_set_invalid_level(self, app_logger):
+        """Test that an unknown level name is ignored"""
+        app_logger.set_level("verbose")
         
-        mock_setup.assert_called_once_with("new_test_logger")
-
-
-class TestLoggerIntegration:
-    """Test logger integration scenarios"""
+        assert app_logger.logger.level == logging.INFO
+        assert settings.log_level == "INFO"
     
-    def test_multiple_loggers_independence(self, test_settings):
-        """Test that multiple loggers work independently"""
-        # Create two loggers with different levels
-        logger1 = setup_logger(
-            name="logger1",
-            log_file=test_settings.log_file,
-            level="DEBUG"
-        )
-        logger2 = setup_logger(
-            name="logger2",
-            log_file=test_settings.log_file,
-            level="ERROR"
-        )
-        
-        # Log different messages
-        logger1.debug("Debug from logger1")
-        logger1.info("Info from logger1")
-        logger2.debug("Debug from logger2")  # Should not appear
-        logger2.error("Error from logger2")
-        
-        # Force flush handlers
-        for handler in logger1.handlers:
-            handler.flush()
-        for handler in logger2.handlers:
-            handler.flush()
-        
-        # Check file content
-        if test_settings.log_file.exists():
-            content = test_settings.log_file.read_text()
-            assert "Debug from logger1" in content
-            assert "Info from logger1" in content
-            assert "Debug from logger2" not in content
-            assert "Error from logger2" in content
+    def test_errors_written_to_error_log(self, app_logger, tmp_path):
+        """Test that errors also go to the dated error log"""
+        app_logger.error("Test error message")
+        app_logger.warning("Test warning message")
+        flush(app_logger)
+        
+        error_log = tmp_path / f"error_{datetime.now().strftime('%Y%m%d')}.log"
+        content = read_log(error_log)
+        assert "Test error message" in content
+        assert "Test warning message" not in content
     
-    def test_logger_exception_handling(self, test_settings):
-        """Test logger exception handling"""
-        logger = setup_logger(
-            name="test_exception_logger",
-            log_file=test_settings.log_file,
-            level="INFO"
-        )
-        
-        # Log an exception
-        try:
-            raise ValueError("Test exception")
-        except Exception as e:
-            logger.exception("Exception occurred")
-        
-        # Force flush handlers
-        for handler in logger.handlers:
-            handler.flush()
-        
-        # Check that exception was logged
-        if test_settings.log_file.exists():
-            content = test_settings.log_file.read_text()
-            assert "Exception occurred" in content
-            assert "ValueError: Test exception" in content
-            assert "Traceback" in content
+    def test_structured_messages(self, app_logger, tmp_path):
+        """Test the structured logging helpers"""
+        app_logger.log_processing_step("asr", "completed", {"segments": 3})
+        app_logger.log_performance("translate", 1.234)
+        app_logger.log_cache_operation("put", "asr_key", 2048)
+        app_logger.log_error_with_context(ValueError("bad input"), {"step": 2})
+        flush(app_logger)
+        
+        content = read_log(tmp_path / "app.log")
+        assert "Processing Step: asr - Status: completed - Details: {'segments': 3}" in content
+        assert "Performance: translate took 1.23s" in content
+        assert "Cache Operation: put - asr_key - Size: 2048 bytes" in content
+        assert "'error_type': 'ValueError'" in content
     
-    def test_logger_performance(self, test_settings):
-        """Test logger performance with many messages"""
-        logger = setup_logger(
-            name="test_performance_logger",
-            log_file=test_settings.log_file,
-            level="INFO"
-        )
-        
-        # Log many messages
-        import time
-        start_time = time.time()
-        
-        for i in range(1000):
-            logger.info(f"Performance test message {i}")
-        
-        end_time = time.time()
-        
-        # Force flush handlers
-        for handler in logger.handlers:
-            handler.flush()
-        
-        # Check that it didn't take too long (should be < 1 second for 1000 messages)
-        assert end_time - start_time < 1.0
-        
-        # Check that messages were written
-        if test_settings.log_file.exists():
-            content = test_settings.log_file.read_text()
-            assert "Performance test message 0" in content
-            assert "Performance test message 999" in content
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    def test_log_files_and_stats(self, app_logger, tmp_path):
+        """Test listing log files and reading their stats"""
+        app_logger.error("Test error message")
+        flush(app_logger)
+        
+        log_files = app_logger.get_log_files()
+        stats = app_logger.get_log_stats()
+        
+        assert {f.name for f in log_files} == {"app.log", f"error_{datetime.now().strftime('%Y%m%d')}.log"}
+        assert stats["log_files"] == 2
+        assert stats["total_size_bytes"] > 0
+        assert stats["log_directory"] == str(tmp_path)
+        assert stats["log_level"] == "INFO"
@@ -0,0 +1,138 @@
+"""
+Unit tests for progress display component
+"""
+
+import pytest
+import threading
+
+ctk = pytest.importorskip("customtkinter")
+
+from movie_translate.ui.progress_display import ProgressDisplay
+
+
+class Host(ctk.CTkFrame):
+    """Parent frame recording the display's notifications"""
+    
+    def __init__(self, master):
+        super().__init__(master)
+        self.events = []
+    
+    def on_operation_completed(self):
+        """Record completion"""
+        self.events.append("completed")
+    
+    def on_operation_error(self, error_message):
+        """Record an error"""
+        self.events.append(("error", error_message))
+
+
+@pytest.fixture
+def host(tk_root):
+    """Parent frame for the progress display"""
+    frame = Host(tk_root)
+    frame.grid()
+    return frame
+
+
+@pytest.fixture
+def display(host):
+    """Progress display attached to a withdrawn root"""
+    return ProgressDisplay(host)
+
+
+class TestProgressQueue:
+    """Test queued updates and their drain"""
+    
+    def test_update_applied_by_drain(self, display, pump_events):
+        """Test that a queued update is applied on the Tk thread"""
+        display.show("导出视频")
+        display.update_progress(40, "处理中")
+        
+        assert pump_events(lambda: display.get_progress() == 40)
+        assert display.status_var.get() == "处理中"
+        assert display.percent_var.get() == "40%"
+    
+    def test_update_from_worker_thread(self, display, pump_events):
+        """Test that updates queued from another thread are applied"""
+        display.show("导出视频")
+        
+        worker = threading.Thread(target=lambda: [display.update_progress(v) for v in range(0, 61, 10)])
+        worker.start()
+        worker.join()
+        
+        assert pump_events(lambda: display.get_progress() == 60)
+    
+    def test_hide_applies_final_update(self, display, host):
+        """Test that update_progress(100) right before hide() still completes"""
+        display.show("导出视频")
+        display.update_progress(100, "导出完成")
+        display.hide()
+        
+        assert host.events == ["completed"]
+        assert display.get_progress() == 0
+    
+    def test_show_drops_updates_queued_while_hidden(self, display, host, pump_events):
+        """Test that updates sent after hide() do not reach the next operation"""
+        display.show("第一次")
+        display.hide()
+        display.update_progress(70)
+        display.set_error("旧错误")
+        
+        display.show("第二次")
+        pump_events(timeout=3 * ProgressDisplay.DRAIN_INTERVAL_MS / 1000)
+        
+        assert display.get_progress() == 0
+        assert host.events == []
+
+
+class TestSubtaskProgress:
+    """Test overall progress derived from subtasks"""
+    
+    def test_weighted_overall_progress(self, display, pump_events):
+        """Test that overall progress follows the subtask weights"""
+        display.show("导出视频")
+        display.add_subtask("audio", "音频", weight=1.0)
+        display.add_subtask("video", "视频", weight=3.0)
+        display.complete_subtask("video")
+        
+        assert pump_events(lambda: display.get_progress() == 75)
+        
+        display.update_subtask("audio", 50)
+        
+        assert pump_events(lambda: display.get_progress() == 87)
+    
+    def test_progress_moving_back(self, display, pump_events):
+        """Test that a subtask going back lowers the overall progress"""
+        display.show("导出视频")
+        display.add_subtask("audio", "音频")
+        display.add_subtask("video", "视频")
+        display.update_subtask("audio", 80)
+        assert pump_events(lambda: display.get_progress() == 40)
+        
+        display.fail_subtask("audio", "失败")
+        
+        assert pump_events(lambda: display.get_progress() == 0)
+    
+    def test_unknown_subtask_is_ignored(self, display, pump_events):
+        """Test that updates for unknown subtasks change nothing"""
+        display.show("导出视频")
+        display.add_subtask("audio", "音频")
+        display.update_subtask("missing", 100)
+        pump_events(timeout=3 * ProgressDisplay.DRAIN_INTERVAL_MS / 1000)
+        
+        assert display.get_progress() == 0
+    
+    def test_totals_reset_between_operations(self, display, pump_events):
+        """Test that a new operation starts from fresh totals"""
+        display.show("第一次")
+        display.add_subtask("audio", "音频", weight=4.0)
+        display.complete_subtask("audio")
+        assert pump_events(lambda: display.get_progress() == 100)
+        display.hide()
+        
+        display.show("第二次")
+        display.add_subtask("audio", "音频")
+        display.add_subtask("video", "视频")
+        display.complete_subtask("video")
+        
+        assert pump_events(lambda: display.get_progress() == 50)
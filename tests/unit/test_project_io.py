@@ -0,0 +1,84 @@
+"""
+Unit tests for project save/load in the API client module
+"""
+
+import asyncio
+import json
+
+import pytest
+
+client_module = pytest.importorskip("movie_translate.api.client")
+
+from movie_translate.api.client import ProjectManager, _dump_project_json, _load_project_json
+
+
+PROJECT = {
+    "name": "测试项目",
+    "steps": {1: {"status": "done"}, 2: {"status": "pending"}},
+    "characters": [{"id": "c1", "name": "角色", "segments": [0.5, 1.25]}],
+    "settings": {"target_language": "en", "enabled": True, "voice": None},
+}
+
+
+class TestProjectJson:
+    """Test project JSON serialization"""
+
+    def test_orjson_matches_json(self, monkeypatch):
+        """Test that the orjson and json paths produce the same bytes"""
+        orjson = pytest.importorskip("orjson")
+
+        monkeypatch.setattr(client_module, "orjson", orjson)
+        fast = _dump_project_json(PROJECT)
+
+        monkeypatch.setattr(client_module, "orjson", None)
+        fallback = _dump_project_json(PROJECT)
+
+        assert fast == fallback
+
+    def test_non_str_keys_become_strings(self):
+        """Test that integer keys are written as strings"""
+        data = _load_project_json(_dump_project_json(PROJECT))
+
+        assert data["steps"] == {"1": {"status": "done"}, "2": {"status": "pending"}}
+
+    def test_fallback_load(self, monkeypatch):
+        """Test loading without orjson"""
+        monkeypatch.setattr(client_module, "orjson", None)
+
+        data = _load_project_json(json.dumps({"name": "测试"}).encode("utf-8"))
+
+        assert data == {"name": "测试"}
+
+
+class TestProjectFiles:
+    """Test saving and loading project files"""
+
+    @pytest.mark.parametrize("use_aiofiles", [True, False])
+    def test_save_load_round_trip(self, tmp_path, monkeypatch, use_aiofiles):
+        """Test that a saved project loads back as the current project"""
+        if not use_aiofiles:
+            monkeypatch.setattr(client_module, "aiofiles", None)
+        elif client_module.aiofiles is None:
+            pytest.skip("aiofiles not installed")
+
+        file_path = str(tmp_path / "project.json")
+        project = {"name": "测试项目", "files": ["a.mp4"], "step": 3}
+
+        manager = ProjectManager(api_client=None)
+        manager.current_project = project
+        asyncio.run(manager.save_project(file_path))
+
+        loader = ProjectManager(api_client=None)
+        loaded = asyncio.run(loader.load_project(file_path))
+
+        assert loaded == project
+        assert loader.current_project == project
+
+    def test_save_without_project(self, tmp_path, monkeypatch):
+        """Test that saving with no project raises"""
+        monkeypatch.setattr(client_module.error_handler, "handle_error", lambda *args, **kwargs: None)
+
+        manager = ProjectManager(api_client=None)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(manager.save_project(str(tmp_path / "project.json")))
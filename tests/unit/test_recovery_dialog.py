@@ -0,0 +1,115 @@
+"""
+Unit tests for recovery dialog
+"""
+
+import pytest
+import sys
+from datetime import datetime
+
+ctk = pytest.importorskip("customtkinter")
+
+from movie_translate.ui.recovery_dialog import RecoveryDialog, show_recovery_dialog
+
+
+class AsyncHost(ctk.CTkFrame):
+    """Parent frame whose run_async holds on to the requests it gets"""
+    
+    def __init__(self, master):
+        super().__init__(master)
+        self.requests = []
+    
+    def run_async(self, coro, callback=None):
+        """Record the request instead of running it"""
+        coro.close()
+        self.requests.append(callback)
+
+
+@pytest.fixture
+def dialog_recovery(recovery, monkeypatch):
+    """Make the recovery dialog use the temporary interrupt recovery"""
+    dialog_module = sys.modules[RecoveryDialog.__module__]
+    monkeypatch.setattr(dialog_module, "get_interrupt_recovery", lambda: recovery)
+    return recovery
+
+
+def close_dialog_later(root, delay_ms: int = 100):
+    """Close the root's recovery dialog once the event loop is running"""
+    def close():
+        for child in root.winfo_children():
+            if isinstance(child, RecoveryDialog):
+                child.close()
+    
+    root.after(delay_ms, close)
+
+
+def make_info():
+    """Recovery info as returned by get_recovery_snapshot"""
+    return {
+        'has_state': True,
+        'timestamp': datetime.now().isoformat(),
+        'version': "test",
+        'age': 0.0
+    }
+
+
+class TestShowRecoveryDialog:
+    """Test show_recovery_dialog"""
+    
+    def test_returns_none_without_state(self, tk_root, dialog_recovery):
+        """Test that nothing is returned when there is nothing to recover"""
+        close_dialog_later(tk_root)
+        
+        assert show_recovery_dialog(tk_root) is None
+    
+    def test_returns_saved_state(self, tk_root, dialog_recovery):
+        """Test that the saved state is returned and adopted"""
+        state = {"project": {"name": "demo", "current_step": 2}}
+        dialog_recovery.write_snapshot(state)
+        close_dialog_later(tk_root)
+        
+        assert show_recovery_dialog(tk_root) == state
+        assert dialog_recovery.current_state == state
+    
+    def test_reopened_dialog_reloads(self, tk_root, dialog_recovery):
+        """Test that showing the dialog again picks up newer state"""
+        close_dialog_later(tk_root)
+        assert show_recovery_dialog(tk_root) is None
+        
+        state = {"project": {"name": "demo"}}
+        dialog_recovery.write_snapshot(state)
+        close_dialog_later(tk_root)
+        
+        assert show_recovery_dialog(tk_root) == state
+
+
+class TestRecoveryDataLoading:
+    """Test loading recovery data through the parent's run_async"""
+    
+    def test_stale_load_is_ignored(self, tk_root, dialog_recovery):
+        """Test that a load started before the dialog was reopened is dropped"""
+        host = AsyncHost(tk_root)
+        dialog = RecoveryDialog(host)
+        dialog.close()
+        dialog.show()
+        
+        assert len(host.requests) == 2
+        first, second = host.requests
+        
+        first((make_info(), {"step": 1}, []), None)
+        assert dialog.recovery_data is None
+        
+        second((make_info(), {"step": 2}, []), None)
+        assert dialog.recovery_data == {"step": 2}
+        
+        dialog.destroy()
+    
+    def test_failed_load_leaves_no_data(self, tk_root, dialog_recovery):
+        """Test that a failed load leaves the dialog without recovery data"""
+        host = AsyncHost(tk_root)
+        dialog = RecoveryDialog(host)
+        
+        host.requests[0](None, OSError("disk error"))
+        
+        assert dialog.recovery_data is None
+        
+        dialog.destroy()